@@ -1,5 +1,6 @@
 from graphics import GraphWin, color_rgb, Rectangle, Point, Text
 from random import randint
+from functools import lru_cache
 import time
 
 # ------------------------------------------------------------------------------------------------------------------
@@ -20,55 +21,14 @@ def is_color_adjacient(
     Returns:
         bool: are first and second and, if provided, third sides adjacient ?
     """
-
-    def is_color_adjacient_2(first_color: str, second_color: str) -> bool:
-        """Check if first side is adjacient to second side.
-
-        Args:
-            first_color (str): color first side
-            second_color (str): color second side
-
-        Returns:
-            bool: are first and second sides adjacient ?
-        """
-        cube_colors_sequences = [
-            ["c", "o", "g", "r"],  # cyan, orange, green, red on the first rotation axis
-            [
-                "c",
-                "b",
-                "g",
-                "y",
-            ],  # cyan, black, green, yellow on the second rotation axis
-            ["b", "r", "y", "o"],
-        ]  # black, red, yellow, orange on the last rotation axis
-        if first_color == second_color:
-            return False
-
-        for seq in cube_colors_sequences:
-            index_1 = None
-            index_2 = None
-            for i in range(len(seq)):
-                if seq[i] == first_color:
-                    index_1 = i
-
-                if seq[i] == second_color:
-                    index_2 = i
-
-            if index_1 != None and index_2 != None:
-                if abs(index_1 - index_2) == 1 or abs(index_1 - index_2) == 3:
-                    return True
-
-        return False
-
-    # main
     if third_color == None:
-        return is_color_adjacient_2(first_color, second_color)
+        return (first_color, second_color) in adjacient_color_pairs
 
     if first_color != second_color != third_color:
         if (
-            is_color_adjacient(first_color, second_color)
-            and is_color_adjacient(second_color, third_color)
-            and is_color_adjacient(first_color, third_color)
+            (first_color, second_color) in adjacient_color_pairs
+            and (second_color, third_color) in adjacient_color_pairs
+            and (first_color, third_color) in adjacient_color_pairs
         ):
             return True
 
@@ -84,16 +44,10 @@ def reorder(word: str) -> str:
     Returns:
         str: sorted string
     """
-    chars = []
-    chars.extend(word)
-    chars.sort()
-    new_word = ""
-    for char in chars:
-        new_word = new_word + char
-
-    return new_word
+    return "".join(sorted(word))
 
 
+@lru_cache(maxsize=None)
 def border_orientation(
     first_side: int, second_side: int, default_color_side: int = 0
 ) -> str:
@@ -105,7 +59,8 @@ def border_orientation(
             3 R : right side
             4 F : front side
             5 B : back  side
-        orientation names ("U", "D", "L", "R") based on the first and second side index (as concatened str)
+        orientation names ("U", "D", "L", "R") based on the first and second side index
+        (as 2 digit number: first side * 10 + second side)
 
     Args:
         first_side (int): index first side
@@ -114,50 +69,20 @@ def border_orientation(
     Returns:
         orientation (str): N, S, W, E (North, South, West, East)
     """
-    first_second = str(first_side) + str(second_side)
+    first_second = first_side * 10 + second_side
     orientation = ""
-    orientation_names = {
-        "05": "N",
-        "04": "S",
-        "03": "E",
-        "02": "W",
-        "14": "N",
-        "15": "S",
-        "13": "E",
-        "12": "W",
-        "20": "N",
-        "21": "S",
-        "24": "E",
-        "25": "W",
-        "30": "N",
-        "31": "S",
-        "35": "E",
-        "34": "W",
-        "40": "N",
-        "41": "S",
-        "43": "E",
-        "42": "W",
-        "50": "N",
-        "51": "S",
-        "52": "E",
-        "53": "W",
-    }
-    if first_second in orientation_names.keys():
-        orientation = orientation_names[first_second]
+    if first_second in border_orientation_names:
+        orientation = border_orientation_names[first_second]
         if default_color_side != 0:
             rotation = side_rotation[default_color_side]
             if rotation != 0:
                 rotation = 360 - rotation
-                rotated_orientation = {
-                    90: {"N": "E", "E": "S", "S": "W", "W": "N"},
-                    270: {"N": "W", "W": "S", "S": "E", "E": "N"},
-                    180: {"N": "S", "E": "W", "S": "N", "W": "E"},
-                }
                 orientation = rotated_orientation[rotation][orientation]
 
     return orientation
 
 
+@lru_cache(maxsize=None)
 def corner_orientation(
     first: int, second: int, third: int, default_color_side: int = 0
 ) -> str:
@@ -173,9 +98,9 @@ def corner_orientation(
         orientation (str): NW, SW, EN, ES (North West, South West, North East, South Est)
         if side is specified, the relative side roation is considered (in border_orientation)
     """
-    orientation = border_orientation(first, second, default_color_side)
-    orientation = orientation + border_orientation(first, third, default_color_side)
-    return reorder(orientation)
+    first_second = border_orientation(first, second, default_color_side)
+    first_third = border_orientation(first, third, default_color_side)
+    return corner_orientation_names[(first_second, first_third)]
 
 
 def default_side(color: str) -> int:
@@ -187,126 +112,111 @@ def default_side(color: str) -> int:
     Returns:
         side index (int): index default side
     """
-    cube_sides = {"U": 0, "D": 1, "F": 4, "B": 5, "L": 2, "R": 3}
-    # black is on the up side
-    # red is on the front side
-    default_side_names = {"b": "U", "y": "D", "r": "F", "o": "B", "g": "L", "c": "R"}
-    default_side_name = default_side_names[color]
-    side = cube_sides[default_side_name]
-    return side
+    return default_sides[color]
 
 
-def init_cube():
-    """Initialie cube with the default (solved) pieces
+def piece_home_cell(piece: str, index: int) -> tuple:
+    """Returns the cell of a piece color on the default (solved) cube
+
+    Args:
+        piece (str): piece identifier
+        index (int): index of the piece color in the piece identifier
+            (0 for centers and middles, 0-1 for borders, 0-2 for corners)
 
     Returns:
-        None
+        tuple: side, col and row indexes
     """
-    global cube
+    # centers ("b", "c", "g", "y", "o", "r" )
+    if piece in cube_centers:
+        return default_side(piece), 2, 2
 
-    # set default cube for centers ("b", "c", "g", "y", "o", "r" )
-    for piece in cube_centers:
-        side = default_side(piece)
-        # for centers color = piece (eg: "b", "c", ...)
-        cube[side][2][2] = [piece, piece, 1, None, None]
-
-    # set default cube for middles (eg: "b11", "b12", "b13", "b21", "b23", "b31", "b32", "b33", ...)
-    for piece in cube_middles:
-        side = default_side(piece[0])
-        col = int(piece[1])
-        row = int(piece[2])
-        # for middles color = first letter from piece name (eg: "b11")
-        cube[side][col][row] = [piece[0], piece, 1, None, None]
-
-    # set default cube for borders (eg: "bg0", "bg1", "bg2", "rg0", "rg1", ... )
-    for piece in cube_borders:
+    # middles (eg: "b11", "b12", "b13", "b21", "b23", "b31", "b32", "b33", ...)
+    if piece in cube_middles:
+        return default_side(piece[0]), int(piece[1]), int(piece[2])
+
+    # borders (eg: "bg0", "bg1", "bg2", "rg0", "rg1", ... )
+    if piece in cube_borders:
         # border position offset on the col or the row axis
         offset = int(piece[2])
         side_1 = default_side(piece[0])  # color 1
         side_2 = default_side(piece[1])  # color 2
+        color_side = [[side_1, side_2], [side_2, side_1]][index]
+        orientation = border_orientation(color_side[0], color_side[1])
+        if orientation == "N":  # North
+            if color_side[1] != 5 and color_side[1] != 2:
+                col = 1 + offset
+            else:
+                col = 3 - offset
+
+            row = 0
+
+        if orientation == "S":  # South
+            if color_side[1] != 5:
+                col = 1 + offset
+            else:
+                col = 3 - offset
+
+            row = 4
+
+        if orientation == "E":  # East
+            col = 4
+            if color_side[1] != 3:
+                row = 1 + offset
+            elif color_side[0] != 1:
+                row = 3 - offset
+            else:
+                row = 1 + offset
+
+        if orientation == "W":  # West
+            col = 0
+            if (
+                color_side[1] != 4
+                and color_side[1] != 2
+                or color_side[0] == 0
+                or color_side[0] == 4
+            ):
+                row = 1 + offset
+            else:
+                row = 3 - offset
+
+        return color_side[0], col, row
+
+    # corners ("bco", "bgo", "bcr", "bgr", "coy", "cry", "goy", "gry")
+    side_1 = default_side(piece[0])
+    side_2 = default_side(piece[1])
+    side_3 = default_side(piece[2])
+    color_side = [
+        [side_1, side_2, side_3],
+        [side_2, side_1, side_3],
+        [side_3, side_2, side_1],
+    ][index]
+    orientation = corner_orientation(color_side[0], color_side[1], color_side[2])
+    col, row = corner_orientation_col_row[orientation]
+    return color_side[0], col, row
 
-        # set default cube for border piece in its 2 color sides
-        # the color is the first and second letter of the piece name
-        # and is passed as 3rd element of each color_side sub list
-        for color_side in [[side_1, side_2, piece[0]], [side_2, side_1, piece[1]]]:
-            orientation = border_orientation(color_side[0], color_side[1])
-            if orientation == "N":  # North
-                if color_side[1] != 5 and color_side[1] != 2:
-                    col = 1 + offset
-                else:
-                    col = 3 - offset
-
-                row = 0
-
-            if orientation == "S":  # South
-                if color_side[1] != 5:
-                    col = 1 + offset
-                else:
-                    col = 3 - offset
-
-                row = 4
-
-            if orientation == "E":  # East
-                col = 4
-                if color_side[1] != 3:
-                    row = 1 + offset
-                elif color_side[0] != 1:
-                    row = 3 - offset
-                else:
-                    row = 1 + offset
-
-            if orientation == "W":  # West
-                col = 0
-                if (
-                    color_side[1] != 4
-                    and color_side[1] != 2
-                    or color_side[0] == 0
-                    or color_side[0] == 4
-                ):
-                    row = 1 + offset
-                else:
-                    row = 3 - offset
-
-            cube[color_side[0]][col][row] = [color_side[2], piece, 1, None, None]
-
-    # set default cube for corners ("bco", "bgo", "bcr", "bgr", "coy", "cry", "goy", "gry")
-    for piece in cube_corners:
-        side_1 = default_side(piece[0])
-        side_2 = default_side(piece[1])
-        side_3 = default_side(piece[2])
-
-        # set default cube for corner piece in its 3 color sides
-        # the color is the first, second and thirst letter of the piece name
-        # and is passed as 4th element of each color_side sub list
-        for color_side in [
-            [side_1, side_2, side_3, piece[0]],
-            [side_2, side_1, side_3, piece[1]],
-            [side_3, side_2, side_1, piece[2]],
-        ]:
-            orientation = corner_orientation(
-                color_side[0], color_side[1], color_side[2]
-            )
-            if orientation == "NW":  # North West
-                col = 0
-                row = 0
 
-            if orientation == "SW":  # South West
-                col = 0
-                row = 4
+def init_cube():
+    """Initialie cube with the default (solved) pieces
 
-            if orientation == "EN":  # North East
-                col = 4
-                row = 0
+    Returns:
+        None
+    """
+    global cube
 
-            if orientation == "ES":  # South East
-                col = 4
-                row = 4
+    changed_cells.update(
+        (side, col, row) for side in range(6) for col in range(5) for row in range(5)
+    )
 
-            cube[color_side[0]][col][row][0] = color_side[3]
-            cube[color_side[0]][col][row][1] = piece
-            cube[color_side[0]][col][row][2] = 1  # flagged as changed
+    # copy the default cube (see solved_cube), all cells to be drawn
+    cube = [
+        [[[color, piece, None, None] for color, piece in col] for col in side]
+        for side in solved_cube
+    ]
+    piece_positions.clear()
+    for (piece, index), cell in piece_home_cells.items():
+        piece_positions[(piece, piece[index])] = cell
 
-    if debug or False:
+    if __debug__ and debug:
         print("Cube piece cube positions (count, face, col, row, color, piece):")
         i = 0
         for face in cube:
@@ -337,6 +247,23 @@ def init_cube():
                     i = i + 1
 
 
+def piece_cells(piece: str) -> list[tuple]:
+    """Returns the cells (side, col and row indexes) of a piece on the cube,
+        one per piece color (see piece_positions)
+
+    Args:
+        piece (str): piece identifier
+
+    Returns:
+        list[tuple]: cells of the piece
+    """
+    return [
+        piece_positions[(piece, color)]
+        for color in piece
+        if (piece, color) in piece_positions
+    ]
+
+
 def rotate_side(col_row: list[int], rotation: int = 0) -> list[int]:
     """Returns rotated col and row index side coordinate in respect to the given side rotation.
         If no rotation spefice col and row index remain unchanged.
@@ -373,6 +300,63 @@ def rotate_side(col_row: list[int], rotation: int = 0) -> list[int]:
     )
 
 
+def get_x_y(side_index, col_index, row_index, consider_side_rotation=True):
+    """Return x,y coordinates from sid, col, row and side rotation
+
+    Args:
+        side_index (int)    : 0-5 side index
+        col_index (int)     : 0-4 column index
+        row_index (int)     : o-4 row index
+        consider_side_rotation (bool, optional): consider side rotation. Defaults to True.
+
+    Returns:
+        int, int : x, y coordinates
+    """
+    rotated_col_row = [col_index, row_index]
+    if consider_side_rotation:
+        rotation = side_rotation[side_index]
+        rotated_col_row = rotate_side([col_index, row_index], rotation)
+
+    x = (
+        x_margin
+        + side_grid_pos[side_index][0] * side_size
+        + rotated_col_row[0] * (piece_size + spacer)
+    )
+    y = (
+        y_margin
+        + side_grid_pos[side_index][1] * side_size
+        + rotated_col_row[1] * (piece_size + spacer)
+    )
+
+    return x, y
+
+
+def cursor_frame(side_index, col_index, row_index, frame_width):
+    """Return the (undrawn) cursor frame rectangle of a cell,
+        created once per cell and frame width (see cursor_frames)
+
+    Args:
+        side_index (int)    : 0-5 side index
+        col_index (int)     : 0-4 column index
+        row_index (int)     : 0-4 row index
+        frame_width (int)   : frame line width
+
+    Returns:
+        Rectangle: cursor frame
+    """
+    key = (side_index, col_index, row_index, frame_width)
+    if key not in cursor_frames:
+        x, y = cell_x_y[(side_index, col_index, row_index)]
+        frame = Rectangle(Point(x, y), Point(x + piece_size, y + piece_size))
+        frame.setWidth(frame_width)
+        frame.setOutline(
+            color_rgb(cursor_color_rgb[0], cursor_color_rgb[1], cursor_color_rgb[2])
+        )
+        cursor_frames[key] = frame
+
+    return cursor_frames[key]
+
+
 def display_unfolded_cube(
     scope: str = "cube",
     cursor_pos: list[int] | None = None,
@@ -396,64 +380,8 @@ def display_unfolded_cube(
     global last_move_obj
     global cube
 
-    color_codes = {
-        "c": color_rgb(0, 200, 255),
-        "g": color_rgb(0, 200, 0),
-        "o": color_rgb(255, 140, 0),
-        "r": color_rgb(200, 0, 0),
-        "b": color_rgb(0, 0, 0),
-        "y": color_rgb(255, 255, 0),
-    }
-    background_color_codes = {
-        "c": color_rgb(0, 0, 0),
-        "g": color_rgb(0, 0, 0),
-        "o": color_rgb(0, 0, 0),
-        "r": color_rgb(155, 255, 255),
-        "b": color_rgb(255, 255, 255),
-        "y": color_rgb(0, 0, 255),
-    }
-
-    def get_x_y(side_index, col_index, row_index, consider_side_rotation=True):
-        """Return x,y coordinates from sid, col, row and side rotation
-
-        Args:
-            side_index (int)    : 0-5 side index
-            col_index (int)     : 0-4 column index
-            row_index (int)     : o-4 row index
-            consider_side_rotation (bool, optional): consider side rotation. Defaults to True.
-
-        Returns:
-            int, int : x, y coordinates
-        """
-        rotated_col_row = [col_index, row_index]
-        if consider_side_rotation:
-            rotation = side_rotation[side_index]
-            rotated_col_row = rotate_side([col_index, row_index], rotation)
-
-        x = (
-            x_margin
-            + side_grid_pos[side_index][0] * side_size
-            + rotated_col_row[0] * (piece_size + spacer)
-        )
-        y = (
-            y_margin
-            + side_grid_pos[side_index][1] * side_size
-            + rotated_col_row[1] * (piece_size + spacer)
-        )
-
-        return x, y
-
-    def side_iter(side_sequence):
-        """Iterate over specified cube side list
-
-        Args:
-            side_sequence (list): list of cube sides
-
-        Yields:
-            int: next side index
-        """
-        for index in side_sequence:
-            yield cube[index]
+    if not render_enabled:  # rendering suspended (e.g. while solving)
+        return
 
     if scope == "cursor" and cursor_obj[0] != None:
         cursor_obj[0].undraw()
@@ -465,44 +393,40 @@ def display_unfolded_cube(
 
     else:
         if scope in ("cube", "all"):
-            for side in side_iter(side_sequence):
-                side_index = cube.index(side)
-                for col in side:
-                    col_index = side.index(col)
-                    for row in col:
-                        row_index = col.index(row)
-                        if row[2] == 1:  # piece has changed
-                            # coordinate previous rectange (p1)
-                            x0, y0 = 0, 0
-                            x, y = get_x_y(side_index, col_index, row_index)
-                            if row[3] != None:
-                                x0, y0 = row[3].getP1().x, row[3].getP1().y
-                                row[3].move(x - x0, y - y0)
-
-                            else:
-                                # row = [row[0], row[1], row[2], None, row[4] ]
-                                row[3] = Rectangle(  # type: ignore
-                                    Point(x, y),  # type: ignore
-                                    Point(x + piece_size, y + piece_size),
-                                )
-                                row[3].setFill(color_codes[str(row[0])])
-                                row[3].draw(win)
-
-                            if row[4] != None:
-                                row[4].move(x - x0, y - y0)
-
-                            else:
-                                #                                pass
-                                if debug or False:
-                                    # row = [ row[0], row[1], row[2], row[3], None ]
-                                    center = row[3].getCenter()
-                                    row[4] = Text(Point(center.x, center.y), row[1])  # type: ignore
-                                    row[4].setTextColor(
-                                        background_color_codes[str(row[0])]
-                                    )
-                                    row[4].draw(win)
-
-                            row = [row[0], row[1], 0, row[3], row[4]]
+            # only the cells changed since the last redraw (see changed_cells)
+            for cell in list(changed_cells):
+                side_index, col_index, row_index = cell
+                if side_index in side_sequence:
+                    row = cube[side_index][col_index][row_index]
+                    # coordinate previous rectange (p1)
+                    x0, y0 = 0, 0
+                    x, y = cell_x_y[cell]
+                    if row[2] != None:
+                        x0, y0 = row[2].getP1().x, row[2].getP1().y
+                        row[2].move(x - x0, y - y0)
+
+                    else:
+                        # row = [row[0], row[1], None, row[3] ]
+                        row[2] = Rectangle(  # type: ignore
+                            Point(x, y),  # type: ignore
+                            Point(x + piece_size, y + piece_size),
+                        )
+                        row[2].setFill(color_codes[str(row[0])])
+                        row[2].draw(win)
+
+                    if row[3] != None:
+                        row[3].move(x - x0, y - y0)
+
+                    else:
+                        #                                pass
+                        if __debug__ and debug:
+                            # row = [ row[0], row[1], row[2], None ]
+                            center = row[2].getCenter()
+                            row[3] = Text(Point(center.x, center.y), row[1])  # type: ignore
+                            row[3].setTextColor(background_color_codes[str(row[0])])
+                            row[3].draw(win)
+
+                    changed_cells.discard(cell)
 
     if scope in ("cursor", "all"):
         side_index = 0
@@ -535,80 +459,72 @@ def display_unfolded_cube(
                 col_index = cursor_pos[1]
                 row_index = cursor_pos[2]
 
-            x, y = get_x_y(side_index, col_index, row_index)
-            cursor_obj[0] = Rectangle(
-                Point(x, y), Point(x + piece_size, y + piece_size)
-            )
-            cursor_obj[0].setWidth(spacer * 3)
-            cursor_obj[0].setOutline(
-                color_rgb(cursor_color_rgb[0], cursor_color_rgb[1], cursor_color_rgb[2])
-            )
+            cursor_obj[0] = cursor_frame(side_index, col_index, row_index, spacer * 3)
             cursor_obj[0].draw(win)
 
             if col_index in (0, 4) or row_index in (0, 4):
                 cursor_obj_index = 0
-                for s in range(6):
+                piece = cube[side_index][col_index][row_index][1]
+                for s, c, r in piece_cells(piece):
                     if s != side_index:
-                        for c in range(5):
-                            for r in range(5):
-                                if (
-                                    cube[side_index][col_index][row_index][1]
-                                    == cube[s][c][r][1]
-                                ):
-                                    cursor_obj_index = cursor_obj_index + 1
-                                    x, y = get_x_y(s, c, r)
-                                    cursor_obj[cursor_obj_index] = Rectangle(
-                                        Point(x, y),
-                                        Point(x + piece_size, y + piece_size),
-                                    )
-                                    cursor_obj[cursor_obj_index].setWidth(spacer)
-                                    cursor_obj[cursor_obj_index].setOutline(
-                                        color_rgb(
-                                            cursor_color_rgb[0],
-                                            cursor_color_rgb[1],
-                                            cursor_color_rgb[2],
-                                        )
-                                    )
-                                    cursor_obj[cursor_obj_index].draw(win)
+                        cursor_obj_index = cursor_obj_index + 1
+                        cursor_obj[cursor_obj_index] = cursor_frame(s, c, r, spacer)
+                        cursor_obj[cursor_obj_index].draw(win)
 
             else:
                 cursor_obj[1], cursor_obj[2] = None, None
 
-            if cursor_pos_obj != None:
-                cursor_pos_obj.undraw()
-
-            cursor_pos_obj = Text(
-                Point(win.width - 120, win.height - win_bottom_status_height),
-                "cursor : " + str(cursor_pos),
-            )
-            cursor_pos_obj.setTextColor(color_rgb(255, 255, 255))
-            cursor_pos_obj.draw(win)
+            # status texts are drawn once, then only their text is changed
+            if cursor_pos_obj == None:
+                cursor_pos_obj = Text(
+                    Point(win.width - 120, win.height - win_bottom_status_height), ""
+                )
+                cursor_pos_obj.setTextColor(color_rgb(255, 255, 255))
+                cursor_pos_obj.draw(win)
 
-            if cursor_pos_piece_obj != None:
-                cursor_pos_piece_obj.undraw()
+            cursor_pos_obj.setText("cursor : " + str(cursor_pos))
 
-            cursor_pos_piece_obj = None
             if cursor_pos != None:
-                cursor_pos_piece_obj = Text(
-                    Point(win.width - 130, win.height - win_bottom_status_height + 20),
+                if cursor_pos_piece_obj == None:
+                    cursor_pos_piece_obj = Text(
+                        Point(
+                            win.width - 130, win.height - win_bottom_status_height + 20
+                        ),
+                        "",
+                    )
+                    cursor_pos_piece_obj.setTextColor(color_rgb(255, 255, 255))
+                    cursor_pos_piece_obj.draw(win)
+
+                cursor_pos_piece_obj.setText(
                     "piece : "
                     + str(cube[cursor_pos[0]][cursor_pos[1]][cursor_pos[2]][1]).rjust(
                         5, " "
-                    ),
+                    )
                 )
-                cursor_pos_piece_obj.setTextColor(color_rgb(255, 255, 255))
-                cursor_pos_piece_obj.draw(win)
 
-            if last_move_obj != None:
-                last_move_obj.undraw()
+            elif cursor_pos_piece_obj != None:
+                cursor_pos_piece_obj.undraw()
+                cursor_pos_piece_obj = None
 
             if len(moves) > 0:
-                last_move_obj = Text(
-                    Point(win.width - 100, win.height - win_bottom_status_height + 40),
-                    "last : " + str(moves[len(moves) - 1]),
-                )
-                last_move_obj.setTextColor(color_rgb(255, 255, 255))
-                last_move_obj.draw(win)
+                if last_move_obj == None:
+                    last_move_obj = Text(
+                        Point(
+                            win.width - 100, win.height - win_bottom_status_height + 40
+                        ),
+                        "",
+                    )
+                    last_move_obj.setTextColor(color_rgb(255, 255, 255))
+                    last_move_obj.draw(win)
+
+                last_move_obj.setText("last : " + str(moves[len(moves) - 1]))
+
+            elif last_move_obj != None:
+                last_move_obj.undraw()
+                last_move_obj = None
+
+    # the window does not autoflush, update it once for all the changes above
+    win.flush()
 
 
 def display_keys_usage():
@@ -645,8 +561,10 @@ def display_keys_usage():
     t2.draw(win)
     t3.draw(win)
     t4.draw(win)
+    win.flush()
 
 
+@lru_cache(maxsize=None)
 def relative_rotation(from_side: int, to_side: int) -> int:
     """Returns the relative rotation (360 degrees base) between to_side and from side.
 
@@ -676,7 +594,25 @@ def translate_col_row(
     from_side: int, to_side: int, from_col: int, from_row: int
 ) -> list[int]:
     """translate col row coordinates from one side to another
-    keeping piece positions aligned
+    keeping piece positions aligned (looked up in translate_col_row_table)
+
+    Args:
+        from_side (int): source side index
+        to_side (int): target side index
+        from_col (int): source col index
+        from_row (int): source row index
+
+    Returns:
+        col_row (list[int]): translated col and row index
+    """
+    return list(translate_col_row_table[(from_side, to_side, from_col, from_row)])
+
+
+def compute_translate_col_row(
+    from_side: int, to_side: int, from_col: int, from_row: int
+) -> list[int]:
+    """compute the translated col row coordinates of translate_col_row
+    (the entries of translate_col_row_table)
 
     Args:
         from_side (int): source side index
@@ -718,11 +654,6 @@ def navigate_pos(
     Returns:
         list[int]: new position as side, col and row indexes
     """
-    # next side (direction relative to side orientation)
-    next_side_up_rotation = {0: 5, 5: 0, 1: 4, 4: 0, 2: 0, 3: 0}
-    next_side_down_rotation = {0: 4, 4: 1, 1: 5, 5: 1, 2: 1, 3: 1}
-    next_side_right_rotation = {0: 3, 3: 5, 5: 2, 2: 4, 4: 3, 1: 3}
-    next_side_left_rotation = {0: 2, 2: 5, 5: 3, 3: 4, 4: 2, 1: 2}
     rotation = 0
     current_side = position[0]
     current_col = position[1]
@@ -730,12 +661,6 @@ def navigate_pos(
     pos = [0, 2, 2]
 
     # find out col and row chagnes based on the direation
-    direction_to_col_row_change = {
-        "Up": [0, -1],
-        "Down": [0, +1],
-        "Right": [+1, 0],
-        "Left": [-1, 0],
-    }
     col_row_change = direction_to_col_row_change[direction]
     col_change, row_change = col_row_change[0], col_row_change[1]
     next_side = position[0]
@@ -753,15 +678,8 @@ def navigate_pos(
         pos[2] = current_row + row_change
 
     else:
-        # find out next side based on the global next_side_* dictionaries
-        next_side_dict_dict = {
-            "Up": next_side_up_rotation,
-            "Down": next_side_down_rotation,
-            "Left": next_side_left_rotation,
-            "Right": next_side_right_rotation,
-        }
-        next_side_dict = next_side_dict_dict[direction]
-        next_side = next_side_dict[current_side]
+        # find out next side based on the global next_side_by_direction dictionary
+        next_side = next_side_by_direction[direction][current_side]
         # finally set next position (rotate position if necessary based on the relative rotation)
         next_side_col_row = translate_col_row(
             current_side, next_side, current_col, current_row
@@ -784,12 +702,13 @@ def navigate_pos(
         pos[1] = next_side_col_row[0]
         pos[2] = next_side_col_row[1]
 
-    if debug or False:
+    if __debug__ and debug:
         print("navigate: from", position, "to", pos, "rotating", rotation)
 
     return pos
 
 
+@lru_cache(maxsize=None)
 def rotate_direction(side: int, direction: str) -> str:
     """Return the relative direction in respect to the default side rotation
 
@@ -800,8 +719,6 @@ def rotate_direction(side: int, direction: str) -> str:
     Returns:
         str: Up, Down, Left, Right
     """
-    direction_to_rotation = {"Up": 0, "Right": 90, "Down": 180, "Left": 270}
-    rotation_to_direction = {0: "Up", 90: "Right", 180: "Down", 270: "Left"}
     rotation = direction_to_rotation[direction]
     rotation = rotation - side_rotation[side]
     if rotation < 0:
@@ -828,33 +745,38 @@ def navigate_unfolded(
 
 
 def rotate(side: int, rotation: int):
+    """rotate the pieces of a side
 
-    saved_side = [[cube[side][col][row].copy() for row in range(5)] for col in range(5)]
-    for col in range(5):
-        for row in range(5):
-            rotated_col_row = rotate_side([col, row], rotation)
-            cube[side][rotated_col_row[0]][rotated_col_row[1]] = saved_side[col][
-                row
-            ].copy()
-            r = cube[side][rotated_col_row[0]][rotated_col_row[1]]
-            cube[side][rotated_col_row[0]][rotated_col_row[1]] = [
-                r[0],
-                r[1],
-                1,
-                r[3],
-                r[4],
-            ]
+    Args:
+        side (int): side index
+        rotation (int): rotation in degree (90, 180, 270)
+    """
+    side_cells = cube[side]
+    saved_side = [col.copy() for col in side_cells]
+    for col, row, rotated_col, rotated_row in rotate_cells_table[rotation]:
+        r = saved_side[col][row]
+        side_cells[rotated_col][rotated_row] = r
+        piece_positions[(r[1], r[0])] = (side, rotated_col, rotated_row)
 
+    changed_cells.update(side_cells_table[side])
 
-def move(position: list[int], direction: str):
-    """move from one position, identified by side, col and row index towards direction
+
+def move_cycle_cells(side: int, direction: str, index: int) -> tuple:
+    """Returns the cells cycled by a move of a side column (Up, Down) or row (Left, Right)
+        and the lateral side rotation it triggers, if any.
+        The pieces of the source cells are moved to the target cells with the same index.
 
     Args:
-        position (list[int]): side, col, pos indexes
-        direction (str): direction. "Up", "Down", "Left", "Richt
+        side (int): side index
+        direction (str): direction. "Up", "Down", "Left", "Right"
+        index (int): col index (Up, Down) or row index (Left, Right) on the side
+
+    Returns:
+        tuple: source cells, target cells (lists of side, col and row indexes)
+            and lateral side rotation as side index and rotation (None if no rotation)
     """
-    global cursor_obj
-    global cube
+    # only the col (Up, Down) or the row (Left, Right) of the position is relevant
+    position = [side, index, index]
 
     # side move direction sequences (adjusted for relative side orientation)
     side_up_move_cycle = {
@@ -957,89 +879,102 @@ def move(position: list[int], direction: str):
         adjacient_up = adjacient_up_direction[direction]
         adjacient_down = adjacient_down_direction[direction]
 
-    saved_side = [
-        [cube[this_side][col][row].copy() for row in range(5)] for col in range(5)
-    ]
-    cursor_obj[0].undraw()
-    if cursor_obj[1] != None:
-        cursor_obj[1].undraw()
-
-    if cursor_obj[2] != None:
-        cursor_obj[2].undraw()
-
+    source_cells = []
+    target_cells = []
     for side_index in range(4):
         prev_side = prev_sides[side_index]
         prev_cols = [-1 for col in range(5)]
         prev_rows = [-1 for row in range(5)]
-        if side_index < 3:
-            # first 3 sides
-            for col_row_index in range(5):
-                this_c = this_cols[col_row_index]
-                this_r = this_rows[col_row_index]
-                [prev_col, prev_row] = translate_col_row(
-                    this_side, prev_side, this_c, this_r
-                )
-                cube[this_side][this_c][this_r] = cube[prev_side][prev_col][prev_row]
-                r = cube[this_side][this_c][this_r]
-                cube[this_side][this_c][this_r] = [r[0], r[1], 1, r[3], r[4]]
-                prev_cols[col_row_index] = prev_col
-                prev_rows[col_row_index] = prev_row
-
-        else:
-            # last side
-            for col_row_index in range(5):
-                this_c = this_cols[col_row_index]
-                this_r = this_rows[col_row_index]
-                [prev_col, prev_row] = translate_col_row(
-                    this_side, prev_side, this_c, this_r
-                )
-                cube[this_side][this_c][this_r] = saved_side[prev_col][prev_row]
-                r = cube[this_side][this_c][this_r]
-                cube[this_side][this_c][this_r] = [r[0], r[1], 1, r[3], r[4]]
-                prev_cols[col_row_index] = prev_col
-                prev_rows[col_row_index] = prev_row
+        for col_row_index in range(5):
+            this_c = this_cols[col_row_index]
+            this_r = this_rows[col_row_index]
+            [prev_col, prev_row] = translate_col_row(
+                this_side, prev_side, this_c, this_r
+            )
+            source_cells.append((prev_side, prev_col, prev_row))
+            target_cells.append((this_side, this_c, this_r))
+            prev_cols[col_row_index] = prev_col
+            prev_rows[col_row_index] = prev_row
 
         this_side = prev_side
         this_cols = prev_cols.copy()
         this_rows = prev_rows.copy()
 
     # check for lateral side rotations
+    lateral_rotation = None
     if position[1] in (0, 4) and direction in ("Up", "Down"):
         # rotating from position column is on the edge to another side (which has to be rotated)
         # left or right side has to be rotated
         if direction == "Up":
             if position[1] == 0:
-                rotate(adjacient_left[position[0]], 270)
+                lateral_rotation = (adjacient_left[position[0]], 270)
 
             else:
-                rotate(adjacient_right[position[0]], 90)
+                lateral_rotation = (adjacient_right[position[0]], 90)
 
         elif direction == "Down":
             if position[1] == 0:
-                rotate(adjacient_left[position[0]], 90)
+                lateral_rotation = (adjacient_left[position[0]], 90)
 
             else:
-                rotate(adjacient_right[position[0]], 270)
+                lateral_rotation = (adjacient_right[position[0]], 270)
 
     elif position[2] in (0, 4) and direction in ("Left", "Right"):
         # rotating from position row is on the edge to another side (which has to be rotated)
         # up or down side has to be rotated
         if direction == "Left":
             if position[2] == 0:
-                rotate(adjacient_up[position[0]], 90)
+                lateral_rotation = (adjacient_up[position[0]], 90)
 
             else:
-                rotate(adjacient_down[position[0]], 270)
+                lateral_rotation = (adjacient_down[position[0]], 270)
 
         elif direction == "Right":
             if position[2] == 0:
-                rotate(adjacient_up[position[0]], 270)
+                lateral_rotation = (adjacient_up[position[0]], 270)
 
             else:
-                rotate(adjacient_down[position[0]], 90)
+                lateral_rotation = (adjacient_down[position[0]], 90)
+
+    return source_cells, target_cells, lateral_rotation
+
+
+def move(position: list[int], direction: str):
+    """move from one position, identified by side, col and row index towards direction
+
+    Args:
+        position (list[int]): side, col, pos indexes
+        direction (str): direction. "Up", "Down", "Left", "Richt
+    """
+    global cursor_obj
+    global cube
+
+    index = position[1] if direction in ("Up", "Down") else position[2]
+    source_cells, target_cells, lateral_rotation = move_cycle_table[
+        (position[0], direction, index)
+    ]
+    cursor_obj[0].undraw()
+    if cursor_obj[1] != None:
+        cursor_obj[1].undraw()
+
+    if cursor_obj[2] != None:
+        cursor_obj[2].undraw()
+
+    # pick up all the cycled pieces first, then put them down on their new cells
+    # (the cell lists travel with their pieces)
+    pieces = [cube[s][c][r] for s, c, r in source_cells]
+    for cell, p in zip(target_cells, pieces):
+        s, c, r = cell
+        cube[s][c][r] = p
+        piece_positions[(p[1], p[0])] = cell
+
+    changed_cells.update(target_cells)
+
+    if lateral_rotation != None:
+        rotate(lateral_rotation[0], lateral_rotation[1])
 
     moves.append([position, direction])
-    if debug or False:
+    if __debug__ and debug:
         print("        move:", len(moves) - 1, moves[len(moves) - 1])
 
 
@@ -1064,49 +999,22 @@ def move_from_cursor(
             else:
                 move([side, col, i], rotated_direction)
 
-    new_position = position
-    for i in range(6):
-        for j in range(5):
-            for k in range(5):
-                if cube[i][j][k][1] == piece and cube[i][j][k][0] == color:
-                    new_position = [i, j, k]
-
-    return new_position
+    # the cursor follows the piece
+    return find_piece(piece, color)
 
 
 def turn(position, rotation):
-    rotate_from_pos_90_dict = {
-        0: [[5, 0, 0], "Left"],
-        5: [[0, 0, 0], "Left"],
-        4: [[0, 4, 4], "Right"],
-        1: [[5, 4, 4], "Right"],
-        2: [[0, 0, 0], "Down"],
-        3: [[0, 4, 0], "Up"],
-    }
-    rotate_from_pos_270_dict = {
-        0: [[5, 0, 0], "Right"],
-        5: [[0, 0, 0], "Right"],
-        4: [[0, 4, 4], "Left"],
-        1: [[5, 4, 4], "Left"],
-        2: [[0, 0, 0], "Up"],
-        3: [[0, 4, 0], "Down"],
-    }
-    rotate_from_pos_dict = {90: rotate_from_pos_90_dict, 270: rotate_from_pos_270_dict}
     this_side = position[0]
-    if debug or False:
+    if __debug__ and debug:
         print("    turn: this side", this_side, "rotation", rotation)
 
     if rotation == 180:
-        rotate_from_pos = rotate_from_pos_dict[90]
-        from_pos: list[int] = rotate_from_pos[this_side][0]
-        direction = rotate_from_pos[this_side][1]
+        from_pos, direction = turn_moves[90][this_side]
         for i in range(2):
             move(from_pos, direction)
 
     else:
-        rotate_from_pos = rotate_from_pos_dict[rotation]
-        from_pos: list[int] = rotate_from_pos[this_side][0]
-        direction = rotate_from_pos[this_side][1]
+        from_pos, direction = turn_moves[rotation][this_side]
         move(from_pos, direction)
 
 
@@ -1119,983 +1027,1073 @@ def shuffle_cube():
         dir = direction[randint(0, 3)]
         # if dir == "Right" and col == 0 and side in (0, 4) :
         move([side, col, row], dir)
-        display_unfolded_cube("cube")
+        if animate_moves:
+            display_unfolded_cube("cube")
 
+    display_unfolded_cube("cube")
     display_unfolded_cube("cursor", cursor_pos)
 
 
 def new_cube():
     global win
     global cursor_pos
-    global cube
+    global cursor_pos_obj
+    global cursor_pos_piece_obj
+    global last_move_obj
     win.close()
-    win = GraphWin("Cube 5x5x5", width, height)
+    win = GraphWin("Cube 5x5x5", width, height, autoflush=False)
     win.setBackground(color_rgb(63, 63, 63))
-    cube = [
-        [[[any for i in range(5)] for j in range(5)] for k in range(5)]
-        for l in range(6)
-    ]
+    # status texts and cursor frames of the closed window, drawn again on the new one
+    cursor_pos_obj, cursor_pos_piece_obj, last_move_obj = None, None, None
+    cursor_frames.clear()
     init_cube()
     moves.clear()
-    display_unfolded_cube("all", cursor_pos)
+    # keys usage first, its background must not cover the status texts
     display_keys_usage()
+    display_unfolded_cube("all", cursor_pos)
 
 
 def reverse_moves():
-    move_history = [moves[i].copy() for i in range(len(moves) - 1, -1, -1)]
-    for m in move_history:
-        direction = opposite_direction[m[1]]
-        move(m[0], direction)
-        display_unfolded_cube("cube")
+    # last move first (move appends to moves, so walk a reversed copy)
+    for position, direction in moves[::-1]:
+        move(position, opposite_direction[direction])
+        if animate_moves:
+            display_unfolded_cube("cube")
 
     moves.clear()
+    display_unfolded_cube("cube")
     display_unfolded_cube("cursor", cursor_pos)
 
 
-def solve_cube(cursor_pos: list[int], first_color: str = "b"):
-    """Solve the cube using the "human" method
+# ------------------------------------------------------------------------------------------------------------------
+#   Solve cube helper functions
+# ------------------------------------------------------------------------------------------------------------------
+
+
+@lru_cache(maxsize=None)
+def is_side_adjacient(
+    first_side: int, second_side: int, third_side: int | None = None
+) -> bool:
+    """Check if first side is adjacient to second and, if provided, to third side
+        The sides are identified by their side indicies. See cube definition further above
 
     Args:
-        cursor_pos (list): cursor postion as side, col and row index
-        first_color (str, optional): start side color. Defaults to 'b'.
+        first_side : index first side
+        second_side: index second side
+        third_side : index third side. Defaults to None.
+    Returns:
+        boolean: are first and second and, if provided, third sides adjacient ?
     """
-    global cube
+    colors = [
+        default_colors[side]
+        for side in (first_side, second_side, third_side)
+        if side in default_colors
+    ]
+    if len(colors) == 3:
+        return is_color_adjacient(colors[0], colors[1], colors[2])
+    elif len(colors) == 2:
+        return is_color_adjacient(colors[0], colors[1], None)
+    else:
+        return False
 
-    # -----------------------------------------------------------------------------------------------------------
-    #   solve cube helper functions
-    # -----------------------------------------------------------------------------------------------------------
-    def is_side_adjacient(
-        first_side: int, second_side: int, third_side: int | None = None
-    ) -> bool:
-        """Check if first side is adjacient to second and, if provided, to third side
-            The sides are identified by their side indicies. See cube definition further above
-
-        Args:
-            first_side : index first side
-            second_side: index second side
-            third_side : index third side. Defaults to None.
-        Returns:
-            boolean: are first and second and, if provided, third sides adjacient ?
-        """
-        sides = [first_side, second_side, third_side]
-        colors = []
-        for i in range(3):
-            for color in cube_colors:
-                if sides[i] == default_side(color):
-                    colors.append(color)
-        if len(colors) == 3:
-            return is_color_adjacient(colors[0], colors[1], colors[2])
-        elif len(colors) == 2:
-            return is_color_adjacient(colors[0], colors[1], None)
-        else:
-            return False
 
-    def find_piece(piece: str, color: str | None = None) -> list[int]:
-        """_summary_
-
-        Args:
-            piece (str): piece
-            color (str | None, optional): color. Defaults to None.
-
-        Returns:
-            None | list[int]: side, col and row
-        """
-        for side_index in range(6):
-            for col_index in range(5):
-                for row_index in range(5):
-                    if cube[side_index][col_index][row_index][1] == piece:
-                        if (
-                            color == None
-                            or color == cube[side_index][col_index][row_index][0]
-                        ):
-                            return [side_index, col_index, row_index]
+def find_piece(piece: str, color: str) -> list[int]:
+    """_summary_
 
+    Args:
+        piece (str): piece
+        color (str): color
+
+    Returns:
+        list[int]: side, col and row
+    """
+    if (piece, color) not in piece_positions:
         raise Exception(
             f"find_piece({piece}, {color}): case not handled!. Check and fix"
         )
 
-    def relative_direction(from_side: int, to_side: int) -> str:
-        """Return the relative direction form one to another side
-
-        Args:
-            from_side (int): source side index
-            to_side (int): target side index
-
-        Returns:
-            str: Up, Down, Left, Right
-        """
-        if to_side == 0:
-            if debug or False:
-                print("    from side", from_side, "to side", to_side, "direction Up")
-            return "Up"
-        elif to_side == 1:
-            if debug or False:
-                print("    from side", from_side, "to side", to_side, "direction Down")
-            return "Down"
-        else:
-            to_from_side_dict = {
-                2: {0: "Left", 1: "Left", 5: "Right", 4: "Left", 3: "Down"},
-                3: {0: "Right", 1: "Right", 5: "Left", 4: "Right", 2: "Up"},
-                4: {0: "Down", 1: "Up", 3: "Left", 2: "Right", 5: "Right"},
-                5: {0: "Up", 1: "Down", 3: "Right", 2: "Left", 4: "Left"},
-            }
-            if debug or False:
-                print(
-                    "    from side",
-                    from_side,
-                    "to side",
-                    to_side,
-                    "direction",
-                    to_from_side_dict[to_side][from_side],
-                )
-            return to_from_side_dict[to_side][from_side]
-
-    def is_piece_reversed(piece: str, side: int, side_color: str) -> bool:
-        """find if a piece is reversed in respect to a side and color
-
-        Args:
-            piece (str): piece identifier
-            side (int): side index
-            side_color (str): side color
-
-        Returns:
-            bool: is piece reversed?
-        """
-        reversed = False
-        if piece in (cube_borders + cube_corners):
-            # one part of the piece is on the specified side but
-            # with the wrong color
-            for col in cube[side]:
-                for row in col:
-                    if row[1] == piece and row[0] != side_color:
-                        return True
-        return False
+    return list(piece_positions[(piece, color)])
 
-    def is_piece_on_bottom_row(
-        piece: str, from_pos: list[int], to_side: int, side_color: str
-    ) -> bool:
-        """find if a piece is on the bottom row in respect to the target side and color
-            Applies to corner or border pieces
-
-        Args:
-            piece (str): piece identifier
-            from_pos (list): starting position as side, col and row index
-            to_side (int): target side
-            side_color (str): target side color
-
-        Returns:
-            bool: is piece on the bottom row?
-        """
-        from_side = from_pos[0]
-        from_col = from_pos[1]
-        from_row = from_pos[2]
-        if not is_piece_reversed(piece, to_side, side_color):
-            if is_side_adjacient(from_side, to_side):
-                if relative_direction(from_side, to_side) in ("Up", "Down"):
-                    if piece in cube_corners + cube_borders:
-                        if from_row in (0, 4):
-                            return True
-                else:
-                    if piece in cube_corners + cube_borders:
-                        if from_col in (0, 4):
-                            return True
-        return False
 
-    def is_piece_bottom_aligned(
-        piece: str, from_pos: list[int], to_pos: list[int]
-    ) -> bool:
-        """find if a piece is aligned below its target position on the relative bottom row.
+def relative_direction(from_side: int, to_side: int) -> str:
+    """Return the relative direction form one to another side
 
-        Args:
-            from_pos (list): source position as side, col and row index
-            to_pos (list): target position as side, cold and row index
+    Args:
+        from_side (int): source side index
+        to_side (int): target side index
 
-        Returns:
-            bool: is piece aligned?
-        """
-        from_side = from_pos[0]
-        to_side = to_pos[0]
-        if (
-            relative_direction(from_side, to_side) in ("Up", "Down")
-            and piece in cube_borders
-        ):
-            if from_side == border_adjacient_side(to_pos):
-                return True
-            else:
-                return False
-        else:
-            col, row = translate_col_row(
-                from_pos[0], to_pos[0], from_pos[1], from_pos[2]
-            )
-            if col == to_pos[1] and row == to_pos[2]:
-                return True
-            else:
-                return False
-
-    def border_adjacient_side(border_pos: list[int]) -> int:
-        """find the adjacient side of the target position.
-            For border piece positions there is only 1 adjacient side
-
-        Args:
-            border_pos (list[int]): target position
-
-        Returns:
-            int: adjacient side index
-        """
-        border_side = border_pos[0]
-        border_col = border_pos[1]
-        border_row = border_pos[2]
-        for s in range(6):
-            if s != border_side:
-                for c in range(5):
-                    for r in range(5):
-                        if (
-                            cube[border_side][border_col][border_row][1]
-                            == cube[s][c][r][1]
-                        ):
-                            return s
+    Returns:
+        str: Up, Down, Left, Right
+    """
+    direction = relative_directions[(from_side, to_side)]
+    if __debug__ and debug:
+        print("    from side", from_side, "to side", to_side, "direction", direction)
+    return direction
 
-        raise Exception(
-            f"border_adjacient_side(border_pos={border_pos}): case not handled!. Check and fix"
-        )
 
-    def corner_adjacient_sides(corner_pos: list[int]) -> list[int]:
-        """find the adjacient side of the target position.
-            For corner piece positions there there are 2 adjacient sides
-
-        Args:
-            corner_pos (list[int]): target position
-
-        Returns:
-            list[int]: adjacient side indexes
-        """
-        adjacient_sides = []
-        corner_side = corner_pos[0]
-        corner_col = corner_pos[1]
-        corner_row = corner_pos[2]
-        for s in range(6):
-            if s != corner_side:
-                for c in range(5):
-                    for r in range(5):
-                        if (
-                            cube[corner_side][corner_col][corner_row][1]
-                            == cube[s][c][r][1]
-                        ):
-                            adjacient_sides.append(s)
-        return adjacient_sides
-
-    def is_border_lateral_aligned(from_pos: list[int], to_pos: list[int]) -> bool:
-        """find if a border is aligned to be moved to the target position.
-
-        Args:
-            from_pos (list): source position as side, col and row index
-            to_pos (list): target position as side, cold and row index
-
-        Returns:
-            bool: is border aligned?
-        """
-        to_adjacient_side = border_adjacient_side(to_pos)
-        if from_pos[0] == opposite_side[to_adjacient_side]:
+def is_piece_bottom_aligned(piece: str, from_pos: list[int], to_pos: list[int]) -> bool:
+    """find if a piece is aligned below its target position on the relative bottom row.
+
+    Args:
+        from_pos (list): source position as side, col and row index
+        to_pos (list): target position as side, cold and row index
+
+    Returns:
+        bool: is piece aligned?
+    """
+    from_side = from_pos[0]
+    to_side = to_pos[0]
+    if (
+        relative_direction(from_side, to_side) in ("Up", "Down")
+        and piece in cube_borders
+    ):
+        if from_side == border_adjacient_side(to_pos):
+            return True
+        else:
+            return False
+    else:
+        col, row = translate_col_row(from_pos[0], to_pos[0], from_pos[1], from_pos[2])
+        if col == to_pos[1] and row == to_pos[2]:
             return True
         else:
             return False
 
-    def move_reversed_corner_to_bottom_row(from_pos: list[int], to_pos: list[int]):
-        """move reversed corner to the bottom row
 
-        Args:
-            from_pos (list[int]): source corner position
-            to_pos (list[int]): target corner position
-        """
-        direction = relative_direction(from_pos[0], to_pos[0])
-        direction = opposite_direction[direction]
-        move(from_pos, direction)
-        display_unfolded_cube("cube")
-
-        side = opposite_side[to_pos[0]]
-        turn([side, 2, 2], 90)
-        display_unfolded_cube("cube")
-
-        col, row = translate_col_row(from_pos[0], side, from_pos[1], from_pos[2])
-        new_from_pos = [side, col, row]
-        direction = opposite_direction[direction]
-        move(new_from_pos, direction)
-        display_unfolded_cube("cube")
-
-    def move_target_side_corner_to_bottom_row(from_pos: list[int], to_pos: list[int]):
-        """move target side corner down to the bottom row
-
-        Args:
-            from_pos (list[int]): _description_
-            to_pos (list[int]): _description_
-        """
-        move(from_pos, "Down")
-        display_unfolded_cube("cube")
-        opposite = opposite_side[from_pos[0]]
-        turn([opposite, 2, 2], 270)
-        display_unfolded_cube("cube")
-
-    def move_opposite_corner_to_bottom_row(
-        piece: str, from_pos: list[int], to_side: int
-    ):
-        """move corner from the opposite side to the bottom row, in respect to the target side
-
-        Args:
-            piece (str): piece identfier
-            from_pos (list[int]): source position as side, col and row index
-            to_side (int): target side index
-        """
-        for color in piece:
-            if color != first_color:
-                from_adjacient_pos = find_piece(piece, color)
-                from_adjacient_side = 0
-                from_adjacient_col = 0
-                from_adjacient_row = 0
-                if from_adjacient_pos != None:
-                    from_adjacient_side = from_adjacient_pos[0]
-                    from_adjacient_col = from_adjacient_pos[1]
-                    from_adjacient_row = from_adjacient_pos[2]
-                turn_rotation = 270
-                direction = relative_direction(from_adjacient_side, to_side)
-                if (
-                    direction == "Up"
-                    and from_adjacient_col == 4
-                    or direction == "Left"
-                    and from_adjacient_row == 0
-                    or direction == "Right"
-                    and from_adjacient_row == 4
-                    or direction == "Down"
-                    and from_adjacient_col == 0
-                ):
-                    turn_rotation = 90
-
-                # 1. turn once adjacient side
-                turn(from_adjacient_pos, turn_rotation)
-                display_unfolded_cube("cube")
-                # 2. turn twice the opposite side
-                turn(from_pos, turn_rotation)
-                display_unfolded_cube("cube")
-                turn(from_pos, turn_rotation)
-                display_unfolded_cube("cube")
-                # 3. turn adjacient side back
-                turn(from_adjacient_pos, 360 - turn_rotation)
-                display_unfolded_cube("cube")
-                break  # do not repeat fo the second adjacient side
-
-    def move_target_side_border_to_bottom_row(from_pos: list[int], to_pos: list[int]):
-        """move border from the target side down to the bottom row
-
-        Args:
-            from_pos (list[int]): source border position
-            to_pos (list[int]): target border position
-        """
-        from_side = border_adjacient_side(from_pos)
-        direction = relative_direction(from_pos[0], from_side)
-        move(from_pos, direction)
-        display_unfolded_cube("cube")
+def border_adjacient_side(border_pos: list[int]) -> int:
+    """find the adjacient side of the target position.
+        For border piece positions there is only 1 adjacient side
 
-        to_side = to_pos[0]
-        opposite = opposite_side[to_side]
-        turn([opposite, 2, 2], 90)
-        display_unfolded_cube("cube")
+    Args:
+        border_pos (list[int]): target position
 
-        direction = opposite_direction[direction]
-        move(from_pos, direction)
-        display_unfolded_cube("cube")
-
-    def move_reversed_border_to_bottom_row(piece: str, from_pos: list[int], to_side):
-        """move reversed border piece from target side to the bottom row
-        Args:
-            piece (str): piece identfier
-            from_pos (list[int]): source position as side, col and row index
-        """
-        # 1. move border down to to opposite side
-        opposite = opposite_side[to_side]
-        direction = relative_direction(from_pos[0], opposite)
-        move(from_pos, direction)
-        display_unfolded_cube("cube")
-
-        # 2. turn opposite side 180
-        turn([opposite, 2, 2], 180)
-        display_unfolded_cube("cube")
-
-        # 3. move piece up to the bottom row side
-        direction = relative_direction(opposite, from_pos[0])
-        tr_col_row = translate_col_row(from_pos[0], opposite, from_pos[1], from_pos[2])
-        rotated_col_row = rotate_side(tr_col_row, 180)
-        rotated_from_pos = [opposite, rotated_col_row[0], rotated_col_row[1]]
-        move(rotated_from_pos, direction)
-        display_unfolded_cube("cube")
-
-    def move_opposite_border_to_bottom_row(
-        piece: str, from_pos: list[int], to_side: int
-    ):
-        """move border piece from the opposite side to the bottom row, in respect to the target side
-
-        Args:
-            piece (str): piece identfier
-            from_pos (list[int]): source position as side, col and row index
-            to_side (int): target side index
-        """
-        # move border away from its adjacient side
-        adjacient_side = border_adjacient_side(from_pos)
-        direction = relative_direction(from_pos[0], adjacient_side)
-        direction = opposite_direction[direction]
-        move(from_pos, direction)
-        display_unfolded_cube("cube")
+    Returns:
+        int: adjacient side index
+    """
+    adjacient_sides = cell_adjacient_sides.get(
+        (border_pos[0], border_pos[1], border_pos[2])
+    )
+    if adjacient_sides:
+        return adjacient_sides[0]
 
-        # turn target opposite side
-        turn([opposite_side[to_side], 2, 2], 90)
-        display_unfolded_cube("cube")
+    raise Exception(
+        f"border_adjacient_side(border_pos={border_pos}): case not handled!. Check and fix"
+    )
 
-        # reverse first move to not destroy borders on the target side
-        direction = opposite_direction[direction]
-        move(from_pos, direction)
-        display_unfolded_cube("cube")
 
-    def move_aligned_corner(from_pos: list[int], to_pos: list[int]):
-        """move corner previously aligned underneath to target corner position
+def corner_adjacient_sides(corner_pos: list[int]) -> list[int]:
+    """find the adjacient side of the target position.
+        For corner piece positions there there are 2 adjacient sides
 
-        Args:
-            from_pos (list[int]): source position (side, col, row indexes)
-            to_pos (list[int]): target position (side, col, row indexes)
-        """
-        from_side = from_pos[0]
-        from_col = from_pos[1]
-        from_row = from_pos[2]
-        to_side = to_pos[0]
+    Args:
+        corner_pos (list[int]): target position
 
-        turn_rotation = 270
-        direction = relative_direction(from_side, to_side)
-        if (
-            direction == "Up"
-            and from_col == 4
-            or direction == "Left"
-            and from_row == 0
-            or direction == "Right"
-            and from_row == 4
-            or direction == "Down"
-            and from_col == 0
-        ):
-            turn_rotation = 90
-
-        # turn adjacient side forwards
-        turn(from_pos, turn_rotation)
-        display_unfolded_cube("cube")
-        opposite_side_pos = [opposite_side[to_side], 2, 2]
-
-        # turn opposite side
-        turn(opposite_side_pos, turn_rotation)
-        display_unfolded_cube("cube")
-
-        # turn adjacient side backwards
-        turn(from_pos, 360 - turn_rotation)
-        display_unfolded_cube("cube")
-
-    def move_aligned_border_bottom(from_pos: list[int], to_pos: list[int]):
-        from_side = from_pos[0]
-        from_col = from_pos[1]
-        from_row = from_pos[2]
-        to_side = to_pos[0]
-
-        # turn side left
-        turn_rotation = 270
-        turn(from_pos, turn_rotation)
-        display_unfolded_cube("cube")
-
-        # move border left
-        move_direction = relative_direction(from_side, to_side)
-        move_direction = rotated_270_direction[move_direction]
-        rotated_col_row = rotate_side([from_col, from_row], turn_rotation)
-        move([from_side, rotated_col_row[0], rotated_col_row[1]], move_direction)
-        display_unfolded_cube("cube")
-
-        # turn adjacient side backwards
-        turn(from_pos, 360 - turn_rotation)
-        display_unfolded_cube("cube")
-
-    def move_aligned_border_lateral(from_pos: list[int], to_pos: list[int]):
-        from_side = from_pos[0]
-        from_adjacient = border_adjacient_side(from_pos)
-        to_side = to_pos[0]
-
-        # move target position down to the border adjacient side
-        direction = relative_direction(to_side, from_adjacient)
-        move(to_pos, direction)
-        display_unfolded_cube("cube")
-
-        # move border towards its adjacient side
-        direction = relative_direction(from_side, from_adjacient)
-        move(from_pos, direction)
-        display_unfolded_cube("cube")
+    Returns:
+        list[int]: adjacient side indexes
+    """
+    return cell_adjacient_sides[(corner_pos[0], corner_pos[1], corner_pos[2])]
+
+
+def is_border_lateral_aligned(from_pos: list[int], to_pos: list[int]) -> bool:
+    """find if a border is aligned to be moved to the target position.
+
+    Args:
+        from_pos (list): source position as side, col and row index
+        to_pos (list): target position as side, cold and row index
+
+    Returns:
+        bool: is border aligned?
+    """
+    to_adjacient_side = border_adjacient_side(to_pos)
+    if from_pos[0] == opposite_side[to_adjacient_side]:
+        return True
+    else:
+        return False
+
+
+def move_reversed_corner_to_bottom_row(from_pos: list[int], to_pos: list[int]):
+    """move reversed corner to the bottom row
+
+    Args:
+        from_pos (list[int]): source corner position
+        to_pos (list[int]): target corner position
+    """
+    direction = relative_direction(from_pos[0], to_pos[0])
+    direction = opposite_direction[direction]
+    move(from_pos, direction)
+
+    side = opposite_side[to_pos[0]]
+    turn(center_cells[side], 90)
+
+    col, row = translate_col_row(from_pos[0], side, from_pos[1], from_pos[2])
+    new_from_pos = [side, col, row]
+    direction = opposite_direction[direction]
+    move(new_from_pos, direction)
+
+
+def move_target_side_corner_to_bottom_row(from_pos: list[int], to_pos: list[int]):
+    """move target side corner down to the bottom row
+
+    Args:
+        from_pos (list[int]): _description_
+        to_pos (list[int]): _description_
+    """
+    move(from_pos, "Down")
+    opposite = opposite_side[from_pos[0]]
+    turn(center_cells[opposite], 270)
+
+
+def move_opposite_corner_to_bottom_row(
+    piece: str, from_pos: list[int], to_side: int, first_color: str
+):
+    """move corner from the opposite side to the bottom row, in respect to the target side
+
+    Args:
+        piece (str): piece identfier
+        from_pos (list[int]): source position as side, col and row index
+        to_side (int): target side index
+        first_color (str): color first side
+    """
+    for color in piece:
+        if color != first_color:
+            from_adjacient_pos = find_piece(piece, color)
+            from_adjacient_side = 0
+            from_adjacient_col = 0
+            from_adjacient_row = 0
+            if from_adjacient_pos != None:
+                from_adjacient_side = from_adjacient_pos[0]
+                from_adjacient_col = from_adjacient_pos[1]
+                from_adjacient_row = from_adjacient_pos[2]
+            direction = relative_direction(from_adjacient_side, to_side)
+            turn_rotation = corner_turn_rotation[
+                (direction, from_adjacient_col, from_adjacient_row)
+            ]
+
+            # 1. turn once adjacient side
+            turn(from_adjacient_pos, turn_rotation)
+            # 2. turn twice the opposite side
+            turn(from_pos, turn_rotation)
+            turn(from_pos, turn_rotation)
+            # 3. turn adjacient side back
+            turn(from_adjacient_pos, 360 - turn_rotation)
+            break  # do not repeat fo the second adjacient side
+
+
+def move_target_side_border_to_bottom_row(from_pos: list[int], to_pos: list[int]):
+    """move border from the target side down to the bottom row
+
+    Args:
+        from_pos (list[int]): source border position
+        to_pos (list[int]): target border position
+    """
+    from_side = border_adjacient_side(from_pos)
+    direction = relative_direction(from_pos[0], from_side)
+    move(from_pos, direction)
+
+    to_side = to_pos[0]
+    opposite = opposite_side[to_side]
+    turn(center_cells[opposite], 90)
+
+    direction = opposite_direction[direction]
+    move(from_pos, direction)
+
+
+def move_reversed_border_to_bottom_row(piece: str, from_pos: list[int], to_side):
+    """move reversed border piece from target side to the bottom row
+    Args:
+        piece (str): piece identfier
+        from_pos (list[int]): source position as side, col and row index
+    """
+    # 1. move border down to to opposite side
+    opposite = opposite_side[to_side]
+    direction = relative_direction(from_pos[0], opposite)
+    move(from_pos, direction)
+
+    # 2. turn opposite side 180
+    turn(center_cells[opposite], 180)
+
+    # 3. move piece up to the bottom row side
+    direction = relative_direction(opposite, from_pos[0])
+    tr_col_row = translate_col_row(from_pos[0], opposite, from_pos[1], from_pos[2])
+    rotated_col_row = rotate_side(tr_col_row, 180)
+    rotated_from_pos = [opposite, rotated_col_row[0], rotated_col_row[1]]
+    move(rotated_from_pos, direction)
+
+
+def move_opposite_border_to_bottom_row(piece: str, from_pos: list[int], to_side: int):
+    """move border piece from the opposite side to the bottom row, in respect to the target side
+
+    Args:
+        piece (str): piece identfier
+        from_pos (list[int]): source position as side, col and row index
+        to_side (int): target side index
+    """
+    # move border away from its adjacient side
+    adjacient_side = border_adjacient_side(from_pos)
+    direction = relative_direction(from_pos[0], adjacient_side)
+    direction = opposite_direction[direction]
+    move(from_pos, direction)
+
+    # turn target opposite side
+    turn(center_cells[opposite_side[to_side]], 90)
+
+    # reverse first move to not destroy borders on the target side
+    direction = opposite_direction[direction]
+    move(from_pos, direction)
+
+
+def move_aligned_corner(from_pos: list[int], to_pos: list[int]):
+    """move corner previously aligned underneath to target corner position
+
+    Args:
+        from_pos (list[int]): source position (side, col, row indexes)
+        to_pos (list[int]): target position (side, col, row indexes)
+    """
+    from_side = from_pos[0]
+    from_col = from_pos[1]
+    from_row = from_pos[2]
+    to_side = to_pos[0]
+
+    direction = relative_direction(from_side, to_side)
+    turn_rotation = corner_turn_rotation[(direction, from_col, from_row)]
+
+    # turn adjacient side forwards
+    turn(from_pos, turn_rotation)
+    opposite_side_pos = center_cells[opposite_side[to_side]]
+
+    # turn opposite side
+    turn(opposite_side_pos, turn_rotation)
+
+    # turn adjacient side backwards
+    turn(from_pos, 360 - turn_rotation)
+
+
+def move_aligned_border_bottom(from_pos: list[int], to_pos: list[int]):
+    from_side = from_pos[0]
+    from_col = from_pos[1]
+    from_row = from_pos[2]
+    to_side = to_pos[0]
+
+    # turn side left
+    turn_rotation = 270
+    turn(from_pos, turn_rotation)
+
+    # move border left
+    move_direction = relative_direction(from_side, to_side)
+    move_direction = rotated_270_direction[move_direction]
+    rotated_col_row = rotate_side([from_col, from_row], turn_rotation)
+    move([from_side, rotated_col_row[0], rotated_col_row[1]], move_direction)
+
+    # turn adjacient side backwards
+    turn(from_pos, 360 - turn_rotation)
+
+
+def move_aligned_border_lateral(from_pos: list[int], to_pos: list[int]):
+    from_side = from_pos[0]
+    from_adjacient = border_adjacient_side(from_pos)
+    to_side = to_pos[0]
+
+    # move target position down to the border adjacient side
+    direction = relative_direction(to_side, from_adjacient)
+    move(to_pos, direction)
+
+    # move border towards its adjacient side
+    direction = relative_direction(from_side, from_adjacient)
+    move(from_pos, direction)
+
+    # move it then back to the target side
+    col, row = translate_col_row(from_side, from_adjacient, from_pos[1], from_pos[2])
+    direction = relative_direction(from_adjacient, to_side)
+    move([from_adjacient, col, row], direction)
+
+
+def travel_target_positions(piece: str, side: int) -> list[list[int]]:
+    """positions where the piece belongs on side, computed once per piece and side
+
+    Args:
+        piece (str): corner, border or middle piece
+        side (int): target side
+
+    Returns:
+        list[list[int]]: side, col and row of each target position
+    """
+    if (piece, side) in travel_target_positions_cache:
+        return travel_target_positions_cache[(piece, side)]
+
+    if piece in cube_corners:
+        side_0 = default_side(piece[0])
+        side_1 = default_side(piece[1])
+        side_2 = default_side(piece[2])
+        orientation = corner_orientation(side_0, side_1, side_2, side)
+        col_row = corner_orientation_col_row[orientation]
+        positions = [[side, col_row[0], col_row[1]]]
+    else:
+        border_col_row_dict = {"N": [1, 0], "E": [4, 3], "S": [3, 4], "W": [0, 1]}
+        side_0 = default_side(piece[0])
+        side_1 = default_side(piece[1])
+        orientation = border_orientation(side_0, side_1, side)
+        col, row = border_col_row_dict[orientation]
+        positions = []
+        offsets = [int(piece[2]), 2 - int(piece[2])]
+        n = 1 if int(piece[2]) == 1 else 2
+        for i in range(n):
+            if orientation == "N":
+                positions.append([side, col + offsets[i], row])
+            elif orientation == "S":
+                positions.append([side, col - offsets[i], row])
+            elif orientation == "W":
+                positions.append([side, col, row + offsets[i]])
+            elif orientation == "E":
+                positions.append([side, col, row - offsets[i]])
+
+    travel_target_positions_cache[(piece, side)] = positions
+    return positions
+
+
+def travel_case(
+    piece: str, from_pos: list[int], to_side: int, reversed_pieces: set[str]
+) -> str:
+    """classify where a piece is in respect to its target side, for the solve loops
+
+    Args:
+        piece (str): piece identifier
+        from_pos (list): position as side, col and row index
+        to_side (int): target side
+        reversed_pieces (set): pieces on the target side with the wrong color
+
+    Returns:
+        str: "reversed", "target", "opposite", "bottom_row" or "lateral"
+    """
+    from_side = from_pos[0]
+    if piece in reversed_pieces:
+        return "reversed"
+    if from_side == to_side:
+        return "target"
+    if from_side == opposite_side[to_side]:
+        return "opposite"
+    if relative_direction(from_side, to_side) in ("Up", "Down"):
+        if from_pos[2] in (0, 4):
+            return "bottom_row"
+    elif from_pos[1] in (0, 4):
+        return "bottom_row"
+    return "lateral"
+
+
+def fill_piece_travels(color: str, pieces: list[str], side: int) -> list[tuple]:
+    """Find the from / to positions of the misplaced pieces
+
+    Args:
+        color (str): side color
+        pieces (list[str]): pieces to place, all of them must have the color
+            (see color_pieces), the others are not filtered out here
+        side (int): side index
 
-        # move it then back to the target side
-        col, row = translate_col_row(
-            from_side, from_adjacient, from_pos[1], from_pos[2]
+    Returns:
+        list[tuple]: (piece, from_pos, to_pos, case) tuples, see travel_case
+    """
+    if not all(color in piece for piece in pieces):
+        raise Exception(
+            f"fill_piece_travels({color}, {pieces}, {side}): pieces without the color. Check and fix."
         )
-        direction = relative_direction(from_adjacient, to_side)
-        move([from_adjacient, col, row], direction)
-        display_unfolded_cube("cube")
-
-    def fill_piece_travels(color: str, pieces: list[str], side: int):
-        # find misplaced piece from / to positions an keep them in piece_travels list
-        piece_travels = []
-
-        if pieces[0] in cube_corners:
-            # cube_corners
-            col_row_dict = {"NW": [0, 0], "EN": [4, 0], "SW": [0, 4], "ES": [4, 4]}
-            for corner in pieces:
-                if color in corner:
-                    from_pos = find_piece(corner, color)
-                    side_0 = default_side(corner[0])
-                    side_1 = default_side(corner[1])
-                    side_2 = default_side(corner[2])
-                    orientation = corner_orientation(side_0, side_1, side_2, side)
-                    col_row = col_row_dict[orientation]
-                    to_pos = [side, col_row[0], col_row[1]]
-                    if from_pos != to_pos:
-                        piece_travels.append([corner, from_pos, to_pos])
-                        if debug or False:
-                            print(f"travel corner {corner} from {from_pos} to {to_pos}")
-                        # break
-
-        if pieces[0] in cube_borders:
-            # cube_borders
-            border_col_row_dict = {"N": [1, 0], "E": [4, 3], "S": [3, 4], "W": [0, 1]}
-            for border in pieces:
-                if color in border:
-                    from_pos = find_piece(border, color)
-                    side_0 = default_side(border[0])
-                    side_1 = default_side(border[1])
-                    orientation = border_orientation(side_0, side_1, side)
-                    col, row = border_col_row_dict[orientation].copy()
-                    cols = []
-                    rows = []
-                    positions = []
-                    offsets = [int(border[2]), 2 - int(border[2])]
-                    n = 1 if int(border[2]) == 1 else 2
-                    for i in range(n):
-                        cols.append(col)
-                        rows.append(row)
-                        if orientation == "N":
-                            cols[i] += offsets[i]
-                        elif orientation == "S":
-                            cols[i] -= offsets[i]
-                        elif orientation == "W":
-                            rows[i] += offsets[i]
-                        elif orientation == "E":
-                            rows[i] -= offsets[i]
-                        positions.append([side, cols[i], rows[i]])
-
-                    if not from_pos in positions:
-                        for pos in positions:
-                            piece_travels.append([border, from_pos, pos])
-                            if debug or False:
-                                print(
-                                    f"travel border {border} from {from_pos} to {pos}"
-                                )
-                        # break
-
-        if pieces[0] in cube_middles:
-            # cube middles
-            border_col_row_dict = {"N": [1, 0], "E": [4, 3], "S": [3, 4], "W": [0, 1]}
-            for border in pieces:
-                if color in border:
-                    from_pos = find_piece(border, color)
-                    side_0 = default_side(border[0])
-                    side_1 = default_side(border[1])
-                    orientation = border_orientation(side_0, side_1, side)
-                    col, row = border_col_row_dict[orientation].copy()
-                    cols = []
-                    rows = []
-                    positions = []
-                    offsets = [int(border[2]), 2 - int(border[2])]
-                    n = 1 if int(border[2]) == 1 else 2
-                    for i in range(n):
-                        cols.append(col)
-                        rows.append(row)
-                        if orientation == "N":
-                            cols[i] += offsets[i]
-                        elif orientation == "S":
-                            cols[i] -= offsets[i]
-                        elif orientation == "W":
-                            rows[i] += offsets[i]
-                        elif orientation == "E":
-                            rows[i] -= offsets[i]
-                        positions.append([side, cols[i], rows[i]])
-
-                    if not from_pos in positions:
-                        for pos in positions:
-                            piece_travels.append([border, from_pos, pos])
-                            if debug or False:
-                                print(
-                                    f"travel border {border} from {from_pos} to {pos}"
-                                )
-                        break
-
-        # time.sleep(1.0)
-        return piece_travels
-
-    def align_bottom_row_corner(from_pos: list[int], to_pos: list[int]):
-        from_side = from_pos[0]
-        to_side = to_pos[0]
-        from_adjacient_sides = corner_adjacient_sides(from_pos)
-        to_adjacient_sides = corner_adjacient_sides(to_pos)
-        for to_adjacient_side in to_adjacient_sides:
-            for from_adjacient_side in from_adjacient_sides:
-                if from_adjacient_side == to_adjacient_side:
-                    direction = relative_direction(from_side, to_adjacient_side)
-                    move(from_pos, direction)
-                    break
-            else:
-                continue
-            break
-        else:
-            opposite = opposite_side[to_side]
-            turn([opposite, 2, 2], 180)
-        display_unfolded_cube("cube")
-
-    def align_bottom_row_border(from_pos: list[int], to_pos: list[int]):
-        from_side = from_pos[0]
-        to_adjacient_side = border_adjacient_side(to_pos)
-        if is_side_adjacient(from_side, to_adjacient_side):
+
+    piece_travels = []
+    reversed_pieces = {
+        cell[1]
+        for col in cube[side]
+        for cell in col
+        if cell[0] != color and cell[1] in border_corner_pieces
+    }
+
+    for piece in pieces:
+        from_pos = find_piece(piece, color)
+        positions = travel_target_positions(piece, side)
+        if not from_pos in positions:
+            case = travel_case(piece, from_pos, side, reversed_pieces)
+            for pos in positions:
+                piece_travels.append((piece, from_pos, pos.copy(), case))
+                if __debug__ and debug:
+                    print(f"travel piece {piece} from {from_pos} to {pos}")
+            if piece in cube_middles:
+                break
+
+    return piece_travels
+
+
+def align_bottom_row_corner(from_pos: list[int], to_pos: list[int]):
+    from_side = from_pos[0]
+    to_side = to_pos[0]
+    from_adjacient_sides = corner_adjacient_sides(from_pos)
+    to_adjacient_sides = corner_adjacient_sides(to_pos)
+    for to_adjacient_side in to_adjacient_sides:
+        if to_adjacient_side in from_adjacient_sides:
             direction = relative_direction(from_side, to_adjacient_side)
             move(from_pos, direction)
-        else:
-            from_adjacient_side = border_adjacient_side(from_pos)
-            turn([from_adjacient_side, 2, 2], 180)
-        display_unfolded_cube("cube")
-
-
-    def align_lateral_border(from_pos: list[int], to_pos: list[int]):
-        from_side = from_pos[0]
-        to_side   = to_pos[0]
-        to_adjacient_side = border_adjacient_side(to_pos)
-        if from_side == to_adjacient_side:
-            # move lateral border twice (180 turn)
-            direction = relative_direction(from_side, to_side)
-            direction = rotated_90_direction[direction]
-            move(from_pos, direction)
-            move(from_pos, direction)
-        else:
-            # move lateral border once towards its adjacient side
-            from_adjacient_side = border_adjacient_side(from_pos)
-            direction = relative_direction(from_side, from_adjacient_side)
+            return
+
+    opposite = opposite_side[to_side]
+    turn(center_cells[opposite], 180)
+
+
+def align_bottom_row_border(from_pos: list[int], to_pos: list[int]):
+    from_side = from_pos[0]
+    to_adjacient_side = border_adjacient_side(to_pos)
+    if is_side_adjacient(from_side, to_adjacient_side):
+        direction = relative_direction(from_side, to_adjacient_side)
+        move(from_pos, direction)
+    else:
+        from_adjacient_side = border_adjacient_side(from_pos)
+        turn(center_cells[from_adjacient_side], 180)
+
+
+def align_lateral_border(from_pos: list[int], to_pos: list[int]):
+    from_side = from_pos[0]
+    to_side = to_pos[0]
+    to_adjacient_side = border_adjacient_side(to_pos)
+    if from_side == to_adjacient_side:
+        # move lateral border twice (180 turn)
+        direction = relative_direction(from_side, to_side)
+        direction = rotated_90_direction[direction]
+        move(from_pos, direction)
+        move(from_pos, direction)
+    else:
+        # move lateral border once towards its adjacient side
+        from_adjacient_side = border_adjacient_side(from_pos)
+        direction = relative_direction(from_side, from_adjacient_side)
+        move(from_pos, direction)
+
+
+def move_target_side_corner(from_pos: list[int], to_pos: list[int]):
+    from_side = from_pos[0]
+    from_adjacient_sides = corner_adjacient_sides(from_pos)
+    to_adjacient_sides = corner_adjacient_sides(to_pos)
+    for to_adjacient_side in to_adjacient_sides:
+        if to_adjacient_side in from_adjacient_sides:
+            direction = relative_direction(from_side, to_adjacient_side)
             move(from_pos, direction)
-            
-        display_unfolded_cube("cube")
-
-
-    def move_target_side_corner(from_pos: list[int], to_pos: list[int]):
-        from_side = from_pos[0]
-        from_adjacient_sides = corner_adjacient_sides(from_pos)
-        to_adjacient_sides = corner_adjacient_sides(to_pos)
-        for to_adjacient_side in to_adjacient_sides:
-            for from_adjacient_side in from_adjacient_sides:
-                if from_adjacient_side == to_adjacient_side:
-                    direction = relative_direction(from_side, from_adjacient_side)
-                    move(from_pos, direction)
-                    break
-            else:
-                continue
-            break
-        else:
-            turn(to_pos, 180)
-        display_unfolded_cube("cube")
+            return
 
-    # -----------------------------------------------------------------------------------------------------------
-    #   solve functions
-    # -----------------------------------------------------------------------------------------------------------
-    def solve_first_center(first_side: int, first_color: str):
-        """solve center piece of the first side
-
-        Args:
-            first_side (int): first side index
-            first_color (str): color first side
-        """
-        if debug or False:
-            print("solve_first_center")
-
-        pos = find_piece(first_color)
-
-        if pos != None and len(pos) == 3:
-            while first_side != pos[0]:
-                move(pos, relative_direction(pos[0], first_side))
-                display_unfolded_cube("cube")
-                pos = find_piece(first_color)
-        else:
-            raise Exception(
-                f"solve_first_center({first_side}, {first_color}): Casen not hanlded. Check and fix."
-            )
+    turn(to_pos, 180)
 
-    def solve_first_corners(first_side: int, first_color: str):
-        """solve corner pieces of the first side
 
-            If misplaced corners exist then place them to their target position
-            starting with
+def move_cell_travels(position: list[int], direction: str) -> dict:
+    """Returns where a move takes the pieces of the cells it changes
 
-            1. the corners not aligned and on the top row (reversed)
-            2. the corners on the target side but on the wrong position
-            3. the corners which have the target color on the opposite side
-            4. the corners placed on the bottom line (row or col depending on oritentation)
-               of the adjacient side (alligned)
+    Args:
+        position (list[int]): side, col, row indexes
+        direction (str): "Up", "Down", "Left", "Right"
 
-            After one piece has been moved to its correct target place,
-            skip the other and re-evaluate how many misplaced pieces are still there.
+    Returns:
+        dict: target cell (side, col, row) for each changed source cell
+    """
+    index = position[1] if direction in ("Up", "Down") else position[2]
+    source_cells, target_cells, lateral_rotation = move_cycle_table[
+        (position[0], direction, index)
+    ]
+    cell_travels = dict(zip(source_cells, target_cells))
+    if lateral_rotation != None:
+        side = lateral_rotation[0]
+        for col in range(5):
+            for row in range(5):
+                rotated_col, rotated_row = rotate_side([col, row], lateral_rotation[1])
+                cell_travels[(side, col, row)] = (side, rotated_col, rotated_row)
 
-        Args:
-            first_side (int): first side index
-            first_color (str): color first side
-        """
-        if debug or False:
-            print("solve_first_corners")
+    return cell_travels
 
-        misplaced_piece_travels = []
 
-        # process until no more misplaced pieces are found
-        misplaced_piece_travels = fill_piece_travels(
-            first_color, cube_corners, first_side
+def first_corners_distances(first_side: int, first_color: str) -> tuple:
+    """Returns the distance table of the first side corners: the number of side turns
+        needed to solve them, for any placement of them on the cube.
+        The table is built once per first side and color (breadth first search from the
+        solved corners) and kept in first_corners_distances_cache.
+
+        A placement is coded as bytes, one byte per corner with the first color (sorted
+        by corner name): the index in corner_cells of the cell holding its first color.
+        Each side turn is a bytes.translate table moving the corner cell indexes.
+
+    Args:
+        first_side (int): first side index
+        first_color (str): color first side
+
+    Returns:
+        tuple: corners, side turns (side, rotation and translate table) and
+            distances (dict) by placement
+    """
+    if (first_side, first_color) in first_corners_distances_cache:
+        return first_corners_distances_cache[(first_side, first_color)]
+
+    corner_indexes = {cell: i for i, cell in enumerate(corner_cells)}
+    side_turns = []
+    for side in range(6):
+        for rotation in (90, 270):
+            cell_travels = move_cell_travels(*turn_moves[rotation][side])
+            table = bytearray(range(256))
+            for i, cell in enumerate(corner_cells):
+                table[i] = corner_indexes[cell_travels.get(cell, cell)]
+            side_turns.append((side, rotation, bytes(table)))
+
+    corners = [corner for corner in cube_corners if first_color in corner]
+    solved = bytearray()
+    for corner in corners:
+        orientation = corner_orientation(
+            default_side(corner[0]),
+            default_side(corner[1]),
+            default_side(corner[2]),
+            first_side,
         )
-        while len(misplaced_piece_travels) > 0:
-            for travel in misplaced_piece_travels:
-                piece = travel[0]
-                from_pos = travel[1]
-                from_side = from_pos[0]
-                to_pos = travel[2]
-                to_side = to_pos[0]
-                #
-                # case 1: if corner on adjacient side but not aligned and on the top row
-                #          move it down, to be algined later
-                if is_piece_reversed(piece, to_side, first_color):
-                    if debug or False:
-                        print(
-                            f"case 1: corner {piece} on adjecient side but on top row (reversed)"
-                        )
-                    move_reversed_corner_to_bottom_row(from_pos, to_pos)
-                    break
-                #
-                # case 2: if corner on the top side but on the wrong position
-                #          and all other corners are misplaced, then move it
-                #          to the correct position
-                if from_side == to_side and len(misplaced_piece_travels) == 4:
-                    if debug or False:
-                        print(f"case 2a: corner {piece} have have to be rotated")
-                    move_target_side_corner(from_pos, to_pos)
-                    break
-                #
-                # case 2b: if corner on the top side but on the wrong position
-                #          and all other corners are misplaced, then turn it
-                if from_side == to_side and len(misplaced_piece_travels) < 4:
-                    if debug or False:
-                        print(
-                            f"case 2b: corner {piece} have to be move down to the bottom row"
-                        )
-                    move_target_side_corner_to_bottom_row(from_pos, to_pos)
-                    break  # skip and re-evaluate remaining misplaced pieace
-                #
-                # case 3: check if corner is on the opposite side move it up to the bottom row
-                if from_side == opposite_side[to_side]:
-                    if debug or False:
-                        print(
-                            f"case 3: corner {piece} is on the opposite side. Has to be moved to the botton row"
-                        )
-                    move_opposite_corner_to_bottom_row(piece, from_pos, to_side)
-                    break  # skip and re-evaluate remaining misplaced pieace
-                #
-                # case 4: if corner on adjacient side but not reversed then
-                #          align it first than place it.
-                if is_side_adjacient(from_side, to_side) and is_piece_on_bottom_row(
-                    piece, from_pos, to_side, first_color
-                ):
-                    if not is_piece_bottom_aligned(piece, from_pos, to_pos):
-                        if debug or False:
-                            print(f"case 4: corner {piece} is not aligned")
+        col, row = corner_orientation_col_row[orientation]
+        solved.append(corner_indexes[(first_side, col, row)])
+
+    distances = {bytes(solved): 0}
+    placements = [bytes(solved)]
+    distance = 0
+    while len(placements) > 0:
+        distance = distance + 1
+        next_placements = []
+        for placement in placements:
+            for side_turn in side_turns:
+                next_placement = placement.translate(side_turn[2])
+                if next_placement not in distances:
+                    distances[next_placement] = distance
+                    next_placements.append(next_placement)
+        placements = next_placements
+
+    first_corners_distances_cache[(first_side, first_color)] = (
+        corners,
+        side_turns,
+        distances,
+    )
+    return first_corners_distances_cache[(first_side, first_color)]
 
-                        align_bottom_row_corner(from_pos, to_pos)
-                        break  # skip and re-evaluate remaining misplaced pieace
 
-                    if debug or False:
-                        print(f"case 4: corner {piece} is aligned")
+# ------------------------------------------------------------------------------------------------------------------
+#   Solve functions
+# ------------------------------------------------------------------------------------------------------------------
 
-                    move_aligned_corner(from_pos, to_pos)
-                    break  # skip and re-evaluate remaining misplaced pieace
 
-            # process until no more misplaced pieces are found
-            misplaced_piece_travels = fill_piece_travels(
-                first_color, cube_corners, first_side
-            )
-            # time.sleep(1)
-
-    def sovle_first_borders(first_side: int, first_color: str):
-        """If misplaced borders exist place them to their target position starting with
-
-            1. the ones on the target side but on the wrong position
-               -> move it down
-            2. the ones which are on the target side but with the wrong color (reversed)
-               -> move it to the bottem row (down, rotate bottom 180, up)
-            3. the ones on the lateral column
-               -> move it left, relative to the target side, if not lateral aligned
-               -> if lateral aligneed move piece to the target pos
-                  (turn target adjacient side 270, move border right, turn adjacient side back 90)
-            4. the ones on the opposite side
-               -> move it to the bottom row
-            5. the ones placed on the relative bottom row (row or col depending on oritentation)
-               -> move it left, relative to the target side, if not bottom row aligned
-               -> if bottom row alligned move piece to the target pos
-                  ()
-
-          After one piece has been moved to its correct target place,
-          skip the other and re-evaluate how many misplaced pieces are still there.
-
-          Do not skip other missplaced borders because they can be move in other target positions.
-
-        Args:
-            first_side (int): first side index
-            first_color (str): first side color
-        """
-        if debug or False:
-            print("solve_first_borders")
+def solve_first_center(first_side: int, first_color: str):
+    """solve center piece of the first side
 
-        # process until no more misplaced pieces are found
-        misplaced_piece_travels = fill_piece_travels(
-            first_color, cube_borders, first_side
+    Args:
+        first_side (int): first side index
+        first_color (str): color first side
+    """
+    if __debug__ and debug:
+        print("solve_first_center")
+
+    pos = find_piece(first_color, first_color)
+
+    if pos != None and len(pos) == 3:
+        while first_side != pos[0]:
+            move(pos, relative_direction(pos[0], first_side))
+            pos = find_piece(first_color, first_color)
+    else:
+        raise Exception(
+            f"solve_first_center({first_side}, {first_color}): Casen not hanlded. Check and fix."
         )
-        while len(misplaced_piece_travels) > 0:
-            for travel in misplaced_piece_travels:
-                piece = travel[0]
-                from_pos = travel[1]
-                from_side = from_pos[0]
-                to_pos = travel[2]
-                to_side = to_pos[0]
-                col, row = translate_col_row(
-                    to_side, from_side, from_pos[1], from_pos[2]
+
+
+def solve_first_corners(first_side: int, first_color: str):
+    """solve corner pieces of the first side
+
+        If misplaced corners exist then place them to their target position
+        starting with
+
+        1. the corners not aligned and on the top row (reversed)
+        2. the corners on the target side but on the wrong position
+        3. the corners which have the target color on the opposite side
+        4. the corners placed on the bottom line (row or col depending on oritentation)
+           of the adjacient side (alligned)
+
+        After one piece has been moved to its correct target place,
+        skip the other and re-evaluate how many misplaced pieces are still there.
+
+    Args:
+        first_side (int): first side index
+        first_color (str): color first side
+    """
+    if __debug__ and debug:
+        print("solve_first_corners")
+
+    misplaced_piece_travels = []
+
+    # process until no more misplaced pieces are found
+    corners = color_pieces[("corners", first_color)]
+    misplaced_piece_travels = fill_piece_travels(first_color, corners, first_side)
+    while len(misplaced_piece_travels) > 0:
+        for travel in misplaced_piece_travels:
+            piece = travel[0]
+            from_pos = travel[1]
+            to_pos = travel[2]
+            to_side = to_pos[0]
+            case = travel[3]
+            #
+            # case 1: if corner on adjacient side but not aligned and on the top row
+            #          move it down, to be algined later
+            if case == "reversed":
+                if __debug__ and debug:
+                    print(
+                        f"case 1: corner {piece} on adjecient side but on top row (reversed)"
+                    )
+                move_reversed_corner_to_bottom_row(from_pos, to_pos)
+                break
+            #
+            # case 2: if corner on the top side but on the wrong position
+            #          and all other corners are misplaced, then move it
+            #          to the correct position
+            if case == "target" and len(misplaced_piece_travels) == 4:
+                if __debug__ and debug:
+                    print(f"case 2a: corner {piece} have have to be rotated")
+                move_target_side_corner(from_pos, to_pos)
+                break
+            #
+            # case 2b: if corner on the top side but on the wrong position
+            #          and all other corners are misplaced, then turn it
+            if case == "target" and len(misplaced_piece_travels) < 4:
+                if __debug__ and debug:
+                    print(
+                        f"case 2b: corner {piece} have to be move down to the bottom row"
+                    )
+                move_target_side_corner_to_bottom_row(from_pos, to_pos)
+                break  # skip and re-evaluate remaining misplaced pieace
+            #
+            # case 3: check if corner is on the opposite side move it up to the bottom row
+            if case == "opposite":
+                if __debug__ and debug:
+                    print(
+                        f"case 3: corner {piece} is on the opposite side. Has to be moved to the botton row"
+                    )
+                move_opposite_corner_to_bottom_row(
+                    piece, from_pos, to_side, first_color
                 )
-                tr_from_pos = [from_side, col, row]
-                #
-                # case 1 : check if border has to be moved down because already on the target side
-                #          but in the wrong positiion
-                if from_side == to_side and len(misplaced_piece_travels) != 12:
-                    if debug or False:
-                        print(
-                            "case 1: border on target side has to be moved to the bottom row"
-                        )
-                    move_target_side_border_to_bottom_row(from_pos, to_pos)
+                break  # skip and re-evaluate remaining misplaced pieace
+            #
+            # case 4: if corner on adjacient side but not reversed then
+            #          align it first than place it.
+            if case == "bottom_row":
+                if not is_piece_bottom_aligned(piece, from_pos, to_pos):
+                    if __debug__ and debug:
+                        print(f"case 4: corner {piece} is not aligned")
+
+                    align_bottom_row_corner(from_pos, to_pos)
                     break  # skip and re-evaluate remaining misplaced pieace
-                #
-                # case 2 : check if border piece is on the target side but reversed and move it
-                #          down to the bottom row. Use same move as for alligned borders, just take
-                #          the piece aligned on the bottom row
-                if is_piece_reversed(piece, to_side, first_color):
-                    if debug or False:
-                        print(
-                            f"case 2: border {piece} is reversed. Has to be moved down to the bottom row"
-                        )
-                    move_reversed_border_to_bottom_row(piece, from_pos, to_side)
-                    break  # skip and re-evaluate remaining misplaced pieace
-                #
-                # case 3 : check if border piece is on the lateral column.
-                #          rotate it if not lateral aligned to the target position
-                if (
-                    not is_piece_on_bottom_row(piece, from_pos, to_side, first_color)
-                    and not from_side == opposite_side[to_side]
-                ):
-                    if debug or False:
-                        print(
-                            f"case 3: border {piece} is on the lateral column. Has to rotate until aligned."
-                        )
 
-                    if not is_border_lateral_aligned(from_pos, to_pos):
-                        align_lateral_border(from_pos, to_pos)
-                        break
+                if __debug__ and debug:
+                    print(f"case 4: corner {piece} is aligned")
 
-                    if debug or False:
-                        print(
-                            f"case 3: border {piece} is aligned on the lateral column"
-                        )
-                    move_aligned_border_lateral(from_pos, to_pos)
+                move_aligned_corner(from_pos, to_pos)
+                break  # skip and re-evaluate remaining misplaced pieace
+
+        # process until no more misplaced pieces are found
+        misplaced_piece_travels = fill_piece_travels(first_color, corners, first_side)
+        # time.sleep(1)
+
+
+def solve_first_corners_shortest(first_side: int, first_color: str):
+    """solve corner pieces of the first side with the fewest side turns
+
+        Alternative to solve_first_corners, used if solve_first_corners_shortest_path
+        is set. At each step turn the side that brings the corners one turn closer to
+        their target positions, according to the first corners distance table.
+        Only the first side corners are solved this way, the first borders and the
+        following steps are the same with either corners solver.
+
+    Args:
+        first_side (int): first side index
+        first_color (str): color first side
+    """
+    if __debug__ and debug:
+        print("solve_first_corners_shortest")
+
+    corners, side_turns, distances = first_corners_distances(first_side, first_color)
+    corner_indexes = {cell: i for i, cell in enumerate(corner_cells)}
+    current = bytearray()
+    for corner in corners:
+        side, col, row = find_piece(corner, first_color)
+        current.append(corner_indexes[(side, col, row)])
+    placement = bytes(current)
+    while distances[placement] > 0:
+        for side, rotation, table in side_turns:
+            next_placement = placement.translate(table)
+            if distances[next_placement] < distances[placement]:
+                turn(center_cells[side], rotation)
+                placement = next_placement
+                break
+
+
+def sovle_first_borders(first_side: int, first_color: str):
+    """If misplaced borders exist place them to their target position starting with
+
+        1. the ones on the target side but on the wrong position
+           -> move it down
+        2. the ones which are on the target side but with the wrong color (reversed)
+           -> move it to the bottem row (down, rotate bottom 180, up)
+        3. the ones on the lateral column
+           -> move it left, relative to the target side, if not lateral aligned
+           -> if lateral aligneed move piece to the target pos
+              (turn target adjacient side 270, move border right, turn adjacient side back 90)
+        4. the ones on the opposite side
+           -> move it to the bottom row
+        5. the ones placed on the relative bottom row (row or col depending on oritentation)
+           -> move it left, relative to the target side, if not bottom row aligned
+           -> if bottom row alligned move piece to the target pos
+              ()
+
+      After one piece has been moved to its correct target place,
+      skip the other and re-evaluate how many misplaced pieces are still there.
+
+      Do not skip other missplaced borders because they can be move in other target positions.
+
+    Args:
+        first_side (int): first side index
+        first_color (str): first side color
+    """
+    if __debug__ and debug:
+        print("solve_first_borders")
+
+    # process until no more misplaced pieces are found
+    borders = color_pieces[("borders", first_color)]
+    misplaced_piece_travels = fill_piece_travels(first_color, borders, first_side)
+    while len(misplaced_piece_travels) > 0:
+        for travel_index, travel in enumerate(misplaced_piece_travels):
+            piece = travel[0]
+            from_pos = travel[1]
+            to_pos = travel[2]
+            to_side = to_pos[0]
+            case = travel[3]
+            #
+            # case 1 : check if border has to be moved down because already on the target side
+            #          but in the wrong positiion
+            if case == "target" and len(misplaced_piece_travels) != 12:
+                if __debug__ and debug:
+                    print(
+                        "case 1: border on target side has to be moved to the bottom row"
+                    )
+                move_target_side_border_to_bottom_row(from_pos, to_pos)
+                break  # skip and re-evaluate remaining misplaced pieace
+            #
+            # case 2 : check if border piece is on the target side but reversed and move it
+            #          down to the bottom row. Use same move as for alligned borders, just take
+            #          the piece aligned on the bottom row
+            if case == "reversed":
+                if __debug__ and debug:
+                    print(
+                        f"case 2: border {piece} is reversed. Has to be moved down to the bottom row"
+                    )
+                move_reversed_border_to_bottom_row(piece, from_pos, to_side)
+                break  # skip and re-evaluate remaining misplaced pieace
+            #
+            # case 3 : check if border piece is on the lateral column.
+            #          rotate it if not lateral aligned to the target position
+            if case in ("target", "lateral"):
+                if __debug__ and debug:
+                    print(
+                        f"case 3: border {piece} is on the lateral column. Has to rotate until aligned."
+                    )
+
+                if not is_border_lateral_aligned(from_pos, to_pos):
+                    align_lateral_border(from_pos, to_pos)
                     break
-                #
-                # case 4 : check if border is on the opposite side move it up to the bottom row
-                if from_side == opposite_side[to_side]:
-                    if debug or False:
-                        print(
-                            f"case 4: border {piece} is on the opposite side. Has to be moved to the botton row"
-                        )
-                    move_opposite_border_to_bottom_row(piece, from_pos, to_side)
-                    break  # skip and re-evaluate remaining misplaced pieace
-                #
-                # case 5: if border on adjacient side but not reversed then
-                #         align it first than place it.
-                if is_side_adjacient(from_side, to_side) and is_piece_on_bottom_row(
-                    piece, from_pos, to_side, first_color
-                ):
-                    if debug or False:
-                        print(
-                            f"case 5a: border {piece} in on the adjacient side and has to be aligned"
-                        )
-                    if not is_piece_bottom_aligned(piece, from_pos, to_pos):
-                        if misplaced_piece_travels.index(travel) + 1 < len(
-                            misplaced_piece_travels
-                        ):
-                            continue
-
-                        align_bottom_row_border(from_pos, to_pos)
-                        break  # skip and re-evaluate remaining misplaced pieace
-
-                    if debug or False:
-                        print(f"case 5b: border {piece} is aligned")
-                    move_aligned_border_bottom(from_pos, to_pos)
+
+                if __debug__ and debug:
+                    print(f"case 3: border {piece} is aligned on the lateral column")
+                move_aligned_border_lateral(from_pos, to_pos)
+                break
+            #
+            # case 4 : check if border is on the opposite side move it up to the bottom row
+            if case == "opposite":
+                if __debug__ and debug:
+                    print(
+                        f"case 4: border {piece} is on the opposite side. Has to be moved to the botton row"
+                    )
+                move_opposite_border_to_bottom_row(piece, from_pos, to_side)
+                break  # skip and re-evaluate remaining misplaced pieace
+            #
+            # case 5: if border on adjacient side but not reversed then
+            #         align it first than place it.
+            if case == "bottom_row":
+                if __debug__ and debug:
+                    print(
+                        f"case 5a: border {piece} in on the adjacient side and has to be aligned"
+                    )
+                if not is_piece_bottom_aligned(piece, from_pos, to_pos):
+                    if travel_index + 1 < len(misplaced_piece_travels):
+                        continue
+
+                    align_bottom_row_border(from_pos, to_pos)
                     break  # skip and re-evaluate remaining misplaced pieace
 
-            # process until no more misplaced pieces are found
-            misplaced_piece_travels = fill_piece_travels(
-                first_color, cube_borders, first_side
-            )
-            # time.sleep(3)
+                if __debug__ and debug:
+                    print(f"case 5b: border {piece} is aligned")
+                move_aligned_border_bottom(from_pos, to_pos)
+                break  # skip and re-evaluate remaining misplaced pieace
+
+        # process until no more misplaced pieces are found
+        misplaced_piece_travels = fill_piece_travels(first_color, borders, first_side)
+        # time.sleep(3)
+
+
+def solve_first_middles(first_side):
+    pass
+
+
+def solve_row_1_borders(first_side):
+    pass
 
-    def solve_first_middles(first_side):
-        pass
 
-    def solve_row_1_borders(first_side):
-        pass
+def solve_row_2_borders(first_side):
+    pass
 
-    def solve_row_2_borders(first_side):
-        pass
 
-    def place_last_middle_borders(first_side):
-        pass
+def place_last_middle_borders(first_side):
+    pass
 
-    def solve_last_corners(fist_side):
-        pass
 
-    def solve_last_lateral_borders(first_side):
-        pass
+def solve_last_corners(fist_side):
+    pass
 
-    def solve_last_middle_borders(fisrt_side):
-        pass
 
-    def solve_row_3_borders(first_side):
-        pass
+def solve_last_lateral_borders(first_side):
+    pass
 
-    def solve_rest_middles(first_side):
-        pass
+
+def solve_last_middle_borders(fisrt_side):
+    pass
+
+
+def solve_row_3_borders(first_side):
+    pass
+
+
+def solve_rest_middles(first_side):
+    pass
+
+
+def solve_cube(cursor_pos: list[int], first_color: str = "b"):
+    """Solve the cube using the "human" method
+
+    Args:
+        cursor_pos (list): cursor postion as side, col and row index
+        first_color (str, optional): start side color. Defaults to 'b'.
+    """
+    global render_enabled
 
     # -----------------------------------------------------------------------------------------------------------
     #   solve cube main line
     # -----------------------------------------------------------------------------------------------------------
-    first_side = cursor_pos[0]
-    solve_first_center(first_side, first_color)
-    solve_first_corners(first_side, first_color)
-    sovle_first_borders(first_side, first_color)
-    solve_first_middles(first_side)
-    solve_row_1_borders(first_side)
-    solve_row_2_borders(first_side)
-    place_last_middle_borders(first_side)
-    solve_last_corners(first_side)
-    solve_last_lateral_borders(first_side)
-    solve_last_middle_borders(first_side)
-    solve_row_3_borders(first_side)
-    solve_rest_middles(first_side)
+    # do not repaint the cube after each solver move, display it once at the end
+    render_enabled = False
+    try:
+        first_side = cursor_pos[0]
+        solve_first_center(first_side, first_color)
+        if solve_first_corners_shortest_path:
+            solve_first_corners_shortest(first_side, first_color)
+        else:
+            solve_first_corners(first_side, first_color)
+        sovle_first_borders(first_side, first_color)
+        solve_first_middles(first_side)
+        solve_row_1_borders(first_side)
+        solve_row_2_borders(first_side)
+        place_last_middle_borders(first_side)
+        solve_last_corners(first_side)
+        solve_last_lateral_borders(first_side)
+        solve_last_middle_borders(first_side)
+        solve_row_3_borders(first_side)
+        solve_rest_middles(first_side)
+    finally:
+        render_enabled = True
+
+    display_unfolded_cube("cube")
+
+
+# ------------------------------------------------------------------------------------------------------------------
+#   Key handlers
+# ------------------------------------------------------------------------------------------------------------------
+
+
+def on_navigate_key(key: str):
+    """Move the cursor (Up, Down, Left, Right)
+
+    Args:
+        key (str): key pressed
+    """
+    global cursor_pos
+    cursor_pos = navigate_unfolded(cursor_pos, key, side_selected)
+    display_unfolded_cube("cursor", cursor_pos, side_selected)
+
+
+def on_move_key(key: str):
+    """Move the cursor row or col, or the whole side if selected (w, a, s, d)
+
+    Args:
+        key (str): key pressed
+    """
+    global cursor_pos
+    global side_selected
+    cursor_pos = move_from_cursor(cursor_pos, key_to_direction[key], side_selected)
+    side_selected = False
+    display_unfolded_cube("all", cursor_pos)
+
+
+def on_shuffle_key(key: str):
+    """Shuffle the cube (space)
+
+    Args:
+        key (str): key pressed
+    """
+    shuffle_cube()
+    display_unfolded_cube("cursor", cursor_pos)
+
+
+def on_new_key(key: str):
+    """Start with a new cube (n)
+
+    Args:
+        key (str): key pressed
+    """
+    new_cube()
+
+
+def on_reverse_key(key: str):
+    """Reverse all moves (r)
+
+    Args:
+        key (str): key pressed
+    """
+    reverse_moves()
+
+
+def on_turn_key(key: str):
+    """Turn the cursor side left or right (Shift_L, Shift_R)
+
+    Args:
+        key (str): key pressed
+    """
+    turn(cursor_pos, key_to_direction[key])
+    display_unfolded_cube("all", cursor_pos)
+
+
+def on_solve_key(key: str):
+    """Solve the cube (Return)
+
+    Args:
+        key (str): key pressed
+    """
+    solve_cube(cursor_pos)
+    display_unfolded_cube("cursor", cursor_pos)
+
+
+def on_side_selection_key(key: str):
+    """Select or unselect the cursor side (Control_L, Control_R)
+
+    Args:
+        key (str): key pressed
+    """
+    global side_selected
+    if not side_selected:
+        side_selected = True
+    else:
+        side_selected = False
+
+    display_unfolded_cube("cursor", cursor_pos, side_selected)
 
 
 # ------------------------------------------------------------------------------------------------------------------
@@ -2103,8 +2101,18 @@ def solve_cube(cursor_pos: list[int], first_color: str = "b"):
 # ------------------------------------------------------------------------------------------------------------------
 
 # write or not debug messages to the terminal and show piece identifiers on the cube
+# (run with "python -O cube.py" to strip the debug code entirely)
 debug = True
 
+# draw or not the cube (disabled while solving, the cube is then displayed once at the end)
+render_enabled = True
+
+# redraw or not the cube after each shuffle and reverse move (otherwise once at the end)
+animate_moves = False
+
+# solve the first corners with the fewest side turns (distance table) instead of the "human" method
+solve_first_corners_shortest_path = False
+
 
 #  the main list modelling the 5 x 5 x 5 cube elements and their positions within the cube
 #
@@ -2119,17 +2127,26 @@ debug = True
 #                           numbered from left to right
 #   3. dimension :  (0-4) side row
 #                           numbered from left to right
-#   4. dimension :  (0-5) cube element
+#   4. dimension :  (0-3) cube element
 #                           0 face color
 #                           1 piece
-#                           2 postition changed flag (0: unchanged, 1: changed)
-#                           3 graphic_object reference rectangle
-#                           4 graphic object reference text
-element_values = [" ", " ", 0, None, None]
-cube = [
-    [[[e for e in element_values] for r in range(5)] for c in range(5)]
-    for s in range(6)
-]
+#                           2 graphic_object reference rectangle
+#                           3 graphic object reference text
+#   (set by init_cube)
+cube = []
+
+# cell (side, col, row) of each piece color by (piece, color), kept up to date by
+# init_cube, move and rotate (see find_piece)
+piece_positions = {}
+# cells (side, col, row) changed since the last redraw, see display_unfolded_cube
+changed_cells = set()
+# target positions by (piece, side), see travel_target_positions
+travel_target_positions_cache = {}
+
+# corner cells (side, col, row) and the first corners distance tables by first side and color
+# (see first_corners_distances)
+corner_cells = [(s, c, r) for s in range(6) for c in (0, 4) for r in (0, 4)]
+first_corners_distances_cache = {}
 
 # cube colors and pieces
 #   c : cyan
@@ -2139,6 +2156,28 @@ cube = [
 #   b : black
 #   y : yellow
 cube_colors = ["c", "g", "o", "r", "b", "y"]
+# default side by color and back (0 U, 1 D, 2 L, 3 R, 4 F, 5 B)
+#   black is on the up side
+#   red is on the front side
+cube_sides = {"U": 0, "D": 1, "F": 4, "B": 5, "L": 2, "R": 3}
+default_side_names = {"b": "U", "y": "D", "r": "F", "o": "B", "g": "L", "c": "R"}
+default_sides = {color: cube_sides[name] for color, name in default_side_names.items()}
+default_colors = {side: color for color, side in default_sides.items()}
+# adjacient colors pairs, both orders, from the color sequences of the three rotation axes
+#   cyan, orange, green, red on the first rotation axis
+#   cyan, black, green, yellow on the second rotation axis
+#   black, red, yellow, orange on the last rotation axis
+cube_colors_sequences = [
+    ["c", "o", "g", "r"],
+    ["c", "b", "g", "y"],
+    ["b", "r", "y", "o"],
+]
+adjacient_color_pairs = frozenset(
+    (seq[i], seq[(i + j) % 4])
+    for seq in cube_colors_sequences
+    for i in range(4)
+    for j in (1, 3)
+)
 # unique cube piece indentifiers with color(s) and positions
 #   centers : color
 #   middles : color + col + row
@@ -2178,47 +2217,264 @@ corners = {
 }
 cube_corners = list(corners)
 cube_corners.sort()
+# border and corner pieces, for membership tests
+border_corner_pieces = frozenset(cube_borders + cube_corners)
+# borders and corners having a color, by type and color (see fill_piece_travels)
+color_pieces = {
+    (type, color): [piece for piece in pieces if color in piece]
+    for type, pieces in (("borders", cube_borders), ("corners", cube_corners))
+    for color in cube_colors
+}
 
-if debug or False:
+if __debug__ and debug:
     print("Cube piece names:")
     i = 0
-    for cube_pieces in [cube_centers, cube_middles, cube_borders, cube_corners]:
-        type = ""
-        if cube_pieces == cube_centers:
-            type = "centers"
-        if cube_pieces == cube_middles:
-            type = "middles"
-        if cube_pieces == cube_borders:
-            type = "borders"
-        if cube_pieces == cube_corners:
-            type = "corners"
+    for type, cube_pieces in (
+        ("centers", cube_centers),
+        ("middles", cube_middles),
+        ("borders", cube_borders),
+        ("corners", cube_corners),
+    ):
         for piece in cube_pieces:
             print(str(i).rjust(2), type, piece)
             i = i + 1
 
+# border orientation by first and second side index (first side * 10 + second side),
+# see border_orientation
+border_orientation_names = {
+    5: "N",
+    4: "S",
+    3: "E",
+    2: "W",
+    14: "N",
+    15: "S",
+    13: "E",
+    12: "W",
+    20: "N",
+    21: "S",
+    24: "E",
+    25: "W",
+    30: "N",
+    31: "S",
+    35: "E",
+    34: "W",
+    40: "N",
+    41: "S",
+    43: "E",
+    42: "W",
+    50: "N",
+    51: "S",
+    52: "E",
+    53: "W",
+}
+# corner orientation by the two border orientations (sorted), see corner_orientation
+corner_orientation_names = {
+    (first_second, first_third): reorder(first_second + first_third)
+    for first_second in ("N", "S", "E", "W", "")
+    for first_third in ("N", "S", "E", "W", "")
+}
+# corner col and row on a side by corner orientation
+corner_orientation_col_row = {"NW": [0, 0], "EN": [4, 0], "SW": [0, 4], "ES": [4, 4]}
+# orientation after a rotation in degree
+rotated_orientation = {
+    90: {"N": "E", "E": "S", "S": "W", "W": "N"},
+    270: {"N": "W", "W": "S", "S": "E", "E": "N"},
+    180: {"N": "S", "E": "W", "S": "N", "W": "E"},
+}
+
+# cell of each piece color (piece, color index) on the default (solved) cube, see piece_home_cell
+piece_home_cells = {
+    (piece, index): piece_home_cell(piece, index)
+    for pieces, colors in (
+        (cube_centers, 1),
+        (cube_middles, 1),
+        (cube_borders, 2),
+        (cube_corners, 3),
+    )
+    for piece in pieces
+    for index in range(colors)
+}
+
+# default (solved) cube as color and piece by side, col and row, see init_cube
+home_cell_colors = {
+    cell: (piece[index], piece) for (piece, index), cell in piece_home_cells.items()
+}
+solved_cube = tuple(
+    tuple(
+        tuple(home_cell_colors[(side, col, row)] for row in range(5))
+        for col in range(5)
+    )
+    for side in range(6)
+)
+
+# adjacient sides (in side order) of each border and corner cell, the other cells of
+# the piece in that place (fixed, all piece cells move together), see border_adjacient_side
+cell_adjacient_sides = {
+    cell: sorted(
+        piece_home_cells[(piece, other)][0]
+        for other in range(3)
+        if other != index and (piece, other) in piece_home_cells
+    )
+    for (piece, index), cell in piece_home_cells.items()
+    if piece in border_corner_pieces
+}
+
 # init cube with default position
 init_cube()
 
 # side rotation relative to side 0 Up
 side_rotation = {0: 0, 1: 0, 2: 90, 3: 270, 4: 0, 5: 180}
 
+# direction from one side (inner key) to another, not Up or Down side (outer key)
+to_from_side_dict = {
+    2: {0: "Left", 1: "Left", 5: "Right", 4: "Left", 3: "Down"},
+    3: {0: "Right", 1: "Right", 5: "Left", 4: "Right", 2: "Up"},
+    4: {0: "Down", 1: "Up", 3: "Left", 2: "Right", 5: "Right"},
+    5: {0: "Up", 1: "Down", 3: "Right", 2: "Left", 4: "Left"},
+}
+
+# direction from one side to another by from side and to side, see relative_direction
+# (Up to side 0, Down to side 1, otherwise as in to_from_side_dict)
+relative_directions = {
+    (from_side, to_side): "Up"
+    if to_side == 0
+    else "Down"
+    if to_side == 1
+    else to_from_side_dict[to_side][from_side]
+    for to_side in range(6)
+    for from_side in range(6)
+    if to_side in (0, 1) or from_side in to_from_side_dict[to_side]
+}
+
 # opposite sides
 # (the 2nd side in any move cycle is allways the opposite side, direction does not matter)
 opposite_side = {0: 1, 1: 0, 2: 3, 3: 2, 4: 5, 5: 4}
 
 # opposite move directions
 opposite_direction = {"Up": "Down", "Right": "Left", "Down": "Up", "Left": "Right"}
+
+# move directions as rotation in degree and back
+direction_to_rotation = {"Up": 0, "Right": 90, "Down": 180, "Left": 270}
+rotation_to_direction = {0: "Up", 90: "Right", 180: "Down", 270: "Left"}
+
+# next side by navigation direction and current side (direction relative to side orientation)
+next_side_by_direction = {
+    "Up": {0: 5, 5: 0, 1: 4, 4: 0, 2: 0, 3: 0},
+    "Down": {0: 4, 4: 1, 1: 5, 5: 1, 2: 1, 3: 1},
+    "Right": {0: 3, 3: 5, 5: 2, 2: 4, 4: 3, 1: 3},
+    "Left": {0: 2, 2: 5, 5: 3, 3: 4, 4: 2, 1: 2},
+}
+
+# col and row changes by navigation direction
+direction_to_col_row_change = {
+    "Up": [0, -1],
+    "Down": [0, +1],
+    "Right": [+1, 0],
+    "Left": [-1, 0],
+}
+
+# move (position and direction) turning each side by 90 and 270 degrees, see turn
+turn_moves = {
+    90: {
+        0: [[5, 0, 0], "Left"],
+        5: [[0, 0, 0], "Left"],
+        4: [[0, 4, 4], "Right"],
+        1: [[5, 4, 4], "Right"],
+        2: [[0, 0, 0], "Down"],
+        3: [[0, 4, 0], "Up"],
+    },
+    270: {
+        0: [[5, 0, 0], "Right"],
+        5: [[0, 0, 0], "Right"],
+        4: [[0, 4, 4], "Left"],
+        1: [[5, 4, 4], "Left"],
+        2: [[0, 0, 0], "Up"],
+        3: [[0, 4, 0], "Down"],
+    },
+}
+
 rotated_90_direction = {"Up": "Right", "Right": "Down", "Down": "Left", "Left": "Up"}
 rotated_270_direction = {"Up": "Left", "Right": "Up", "Down": "Right", "Left": "Down"}
 
+# side turn (90 or 270) moving a corner by its move direction, col and row
+# (90 if the corner is on the edge matching the direction, see move_aligned_corner)
+corner_turn_rotation = {
+    (direction, col, row): 90
+    if direction == "Up"
+    and col == 4
+    or direction == "Left"
+    and row == 0
+    or direction == "Right"
+    and row == 4
+    or direction == "Down"
+    and col == 0
+    else 270
+    for direction in ("Up", "Right", "Down", "Left")
+    for col in range(5)
+    for row in range(5)
+}
+
+# col and row of each side cell with its rotated col and row by rotation, see rotate
+rotate_cells_table = {
+    rotation: [
+        (col, row, *rotate_side([col, row], rotation))
+        for col in range(5)
+        for row in range(5)
+    ]
+    for rotation in (90, 180, 270)
+}
+# cells (side, col, row) of each side
+side_cells_table = [
+    [(side, col, row) for col in range(5) for row in range(5)] for side in range(6)
+]
+# center cell (side, col, row) of each side, as position of the side turns, see turn
+center_cells = tuple((side, 2, 2) for side in range(6))
+
+# translated col and row by from side, to side, from col and from row, computed once
+translate_col_row_table = {
+    (from_side, to_side, col, row): tuple(
+        compute_translate_col_row(from_side, to_side, col, row)
+    )
+    for from_side in range(6)
+    for to_side in range(6)
+    for col in range(5)
+    for row in range(5)
+}
+
+# cells cycled by each move (side, direction, col or row index), computed once
+move_cycle_table = {
+    (side, direction, index): move_cycle_cells(side, direction, index)
+    for side in range(6)
+    for direction in ("Up", "Down", "Left", "Right")
+    for index in range(5)
+}
+
 # Initialize graphic window
 height = 1090
 width = 740
-win = GraphWin("Cube 5x5x5", width, height)
+win = GraphWin("Cube 5x5x5", width, height, autoflush=False)
 win.setBackground(color_rgb(48, 48, 64))
 win_bottom_status_height = 80
 cursor_color_rgb = [255, 255, 255]
 
+# piece fill and piece identifier text colors by cube color
+color_codes = {
+    "c": color_rgb(0, 200, 255),
+    "g": color_rgb(0, 200, 0),
+    "o": color_rgb(255, 140, 0),
+    "r": color_rgb(200, 0, 0),
+    "b": color_rgb(0, 0, 0),
+    "y": color_rgb(255, 255, 0),
+}
+background_color_codes = {
+    "c": color_rgb(0, 0, 0),
+    "g": color_rgb(0, 0, 0),
+    "o": color_rgb(0, 0, 0),
+    "r": color_rgb(155, 255, 255),
+    "b": color_rgb(255, 255, 255),
+    "y": color_rgb(0, 0, 255),
+}
+
 # Side indexes 0 Up, 1 Down, 2 Left, 3 Right, 4 Front, 5 Back
 side_grid_pos = [[1, 2], [1, 0], [0, 2], [2, 2], [1, 3], [1, 1]]
 piece_size = 45
@@ -2228,8 +2484,18 @@ side_size = (piece_size + spacer) * 5 + side_spacer
 x_margin = (win.width - 3 * side_size) // 2
 y_margin = (win.height - (win_bottom_status_height + 10) - 4 * side_size) // 2
 
+# x, y coordinates of each cell (side, col, row) considering the side rotation, see get_x_y
+cell_x_y = {
+    (side, col, row): get_x_y(side, col, row)
+    for side in range(6)
+    for col in range(5)
+    for row in range(5)
+}
+
 # cursor, rectangle and text object references (from graphics)
 cursor_obj = [any, None, None]
+# cursor frames by cell and frame width, reused while the window is open (see cursor_frame)
+cursor_frames = {}
 cursor_pos_obj = None
 last_move_obj = None
 cursor_pos_piece_obj = None
@@ -2244,8 +2510,8 @@ cursor_pos = [0, 2, 2]
 
 # display cube and keys used for the game
 interval_sec = 0
-display_unfolded_cube("all", cursor_pos)
 display_keys_usage()
+display_unfolded_cube("all", cursor_pos)
 interval_sec = 1
 
 navigate_keys = ("Up", "Down", "Left", "Right")
@@ -2266,6 +2532,16 @@ key_to_direction = {
 }
 side_selected = False
 
+# handler function for each relevant key
+key_handlers = {key: on_navigate_key for key in navigate_keys}
+key_handlers.update({key: on_move_key for key in move_keys})
+key_handlers.update({key: on_turn_key for key in turn_keys})
+key_handlers.update({key: on_side_selection_key for key in side_selection_keys})
+key_handlers[shuffle_key] = on_shuffle_key
+key_handlers[new_key] = on_new_key
+key_handlers[reverse_key] = on_reverse_key
+key_handlers[solve_key] = on_solve_key
+
 # ----------------------------------------------------------------------------------------------------------------
 #   Main loop
 # ----------------------------------------------------------------------------------------------------------------
@@ -2273,49 +2549,9 @@ key = win.getKey().replace("KP_", "")
 while key != "Escape":
 
     # do something only if a relevant key has been pressed
-    if key in navigate_keys + move_keys + turn_keys + side_selection_keys or key in (
-        shuffle_key,
-        reverse_key,
-        new_key,
-        solve_key,
-    ):
-
-        if key in navigate_keys:  # Up, Down, Left, Right
-            cursor_pos = navigate_unfolded(cursor_pos, key, side_selected)
-            display_unfolded_cube("cursor", cursor_pos, side_selected)
-
-        elif key in move_keys:  # w, a, s, d
-            cursor_pos = move_from_cursor(
-                cursor_pos, key_to_direction[key], side_selected
-            )
-            side_selected = False
-            display_unfolded_cube("all", cursor_pos)
-
-        elif key == shuffle_key:  # space
-            shuffle_cube()
-            display_unfolded_cube("cursor", cursor_pos)
-
-        elif key == new_key:  # new
-            new_cube()
-
-        elif key == reverse_key:  # r
-            reverse_moves()
-
-        elif key in turn_keys:  # Shift_L, Shift_R
-            turn(cursor_pos, key_to_direction[key])
-            display_unfolded_cube("all", cursor_pos)
-
-        elif key == solve_key:  # Return
-            solve_cube(cursor_pos)
-            display_unfolded_cube("cursor", cursor_pos)
-
-        elif key in side_selection_keys:  # Control_L, Control_R
-            if not side_selected:
-                side_selected = True
-            else:
-                side_selected = False
-
-            display_unfolded_cube("cursor", cursor_pos, side_selected)
+    key_handler = key_handlers.get(key)
+    if key_handler != None:
+        key_handler(key)
 
     # wait for next key-press
     key = win.getKey().replace("KP_", "")